@@ -10,19 +10,79 @@ Unified module for fetching CBP ruling text via multiple strategies:
 All tiers return the same interface: (normalized_text, pretty_text, source_meta)
 """
 
+import atexit
 import os
 import re
-import json
-from typing import Tuple, Dict, Optional
+import shutil
+import subprocess
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from html.parser import HTMLParser
+from itertools import islice
+from typing import Tuple, Dict, List, Optional, Union
 import requests
-from bs4 import BeautifulSoup
-from pypdf import PdfReader
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import lxml.html
+from lxml import etree
+import hashlib
 import io
+import json
 
 # Constants
-from shared_modules.config import YEAR_CANDIDATES, DOC_URL_TEMPLATE
+from shared_modules.config import build_candidate_urls
 # shared_modules utilities
-from shared_modules.utils import ensure_dir, read_text, normalize_text
+from shared_modules.utils import ensure_dir, read_text, normalize_text, json_loads, write_json
+
+
+# Shared HTTP session for all three tiers: the API, the ruling page and every
+# year candidate of every document download hit the same CBP host, so
+# keep-alive connections are reused instead of paying a new TCP+TLS handshake
+# per request. Tiers 1/2 pass their own headers per call, which take
+# precedence over the session defaults. Transient server errors are
+# retried with backoff; 404s (wrong year) are returned immediately.
+# pool_block caps in-flight requests at the pool size: without it every
+# request past 32 in a batch run opened a fresh connection that was then
+# discarded. Tier-3 year probes use their own session (see _PROBE_SESSION).
+_SESSION = requests.Session()
+_SESSION.headers.update({
+    "User-Agent": "Mozilla/5.0",
+    "Accept-Encoding": "gzip, deflate",
+})
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=32,
+        pool_block=True,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[500, 502, 503, 504]),
+    ),
+)
+
+
+# In-process memo of fetched texts keyed by (tier, ruling_id, cache_dir).
+# Repeat calls in one run (e.g. extraction, then the fetchers report) skip the
+# filesystem: no stat/open/read/decode of the cache files.
+_TEXT_MEMO: Dict[Tuple[int, str, str], Tuple[str, str]] = {}
+_TEXT_MEMO_MAX = 1024
+_MEMO_LOCK = threading.Lock()
+
+
+def _remember_texts(key: Tuple[int, str, str], text_normalized: str, text_pretty: str) -> None:
+    with _MEMO_LOCK:
+        if key not in _TEXT_MEMO and len(_TEXT_MEMO) >= _TEXT_MEMO_MAX:
+            _TEXT_MEMO.pop(next(iter(_TEXT_MEMO)))
+        _TEXT_MEMO[key] = (text_normalized, text_pretty)
+
+
+# Per-(tier, ruling_id, cache_dir) locks held while a tier-3 fetch is in flight.
+_FETCH_LOCKS: Dict[Tuple[int, str, str], threading.Lock] = {}
+
+
+def _fetch_lock(key: Tuple[int, str, str]) -> threading.Lock:
+    with _MEMO_LOCK:
+        return _FETCH_LOCKS.setdefault(key, threading.Lock())
 
 
 # =========================
@@ -48,9 +108,16 @@ def fetch_tier_1(ruling_id: str, cache_dir: str) -> Tuple[str, str, Dict]:
     Raises:
         RuntimeError: If API call fails or returns unusable data
     """
-    ensure_dir(cache_dir)
     ruling_id = ruling_id.strip().upper()
 
+    # Already loaded in this process
+    memo_key = (1, ruling_id, cache_dir)
+    memo = _TEXT_MEMO.get(memo_key)
+    if memo is not None:
+        return memo[0], memo[1], {"source": "tier_1_json_api", "cached": True}
+
+    ensure_dir(cache_dir)
+
     # Cache paths specific to tier 1
     cache_json_path = os.path.join(cache_dir, f"{ruling_id}.tier1.json")
     cache_txt_path = os.path.join(cache_dir, f"{ruling_id}.tier1.normalized.txt")
@@ -58,11 +125,10 @@ def fetch_tier_1(ruling_id: str, cache_dir: str) -> Tuple[str, str, Dict]:
 
     # Return cached if available
     if os.path.exists(cache_txt_path) and os.path.exists(cache_pretty_path):
-        return (
-            read_text(cache_txt_path),
-            read_text(cache_pretty_path),
-            {"source": "tier_1_json_api", "cached": True}
-        )
+        text_normalized = read_text(cache_txt_path)
+        text_pretty = read_text(cache_pretty_path)
+        _remember_texts(memo_key, text_normalized, text_pretty)
+        return text_normalized, text_pretty, {"source": "tier_1_json_api", "cached": True}
 
     # Fetch from API
     api_url = f"https://rulings.cbp.gov/api/ruling/{ruling_id}"
@@ -72,13 +138,22 @@ def fetch_tier_1(ruling_id: str, cache_dir: str) -> Tuple[str, str, Dict]:
     }
 
     try:
-        response = requests.get(api_url, headers=headers, timeout=20)
-        response.raise_for_status()
-        data = response.json()
+        raw_cached = os.path.exists(cache_json_path)
+        if raw_cached:
+            # Raw API response already on disk: rebuild the texts without a network call
+            with open(cache_json_path, "rb") as f:
+                data = json_loads(f.read())
+        else:
+            response = _SESSION.get(api_url, headers=headers, timeout=20)
+            response.raise_for_status()
+            # Parse the UTF-8 body directly (orjson when available) rather than
+            # via response.json(), which decodes to str and uses the stdlib parser
+            data = json_loads(response.content)
 
-        # Save raw JSON
-        with open(cache_json_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+            # Save raw JSON (write-then-rename: a partial file would be trusted above)
+            tmp_json = _tmp_path(cache_json_path)
+            write_json(data, tmp_json)
+            os.replace(tmp_json, cache_json_path)
 
         # Extract text from JSON structure
         raw_text = None
@@ -92,28 +167,17 @@ def fetch_tier_1(ruling_id: str, cache_dir: str) -> Tuple[str, str, Dict]:
         if not raw_text:
             raise RuntimeError(f"No usable text in API response for {ruling_id}")
 
-        # Convert to normalized and pretty formats
-        soup = BeautifulSoup(raw_text, "html.parser")
-        for tag in soup(["script", "style", "noscript"]):
-            tag.decompose()
-
-        text_normalized = normalize_text(soup.get_text("\n"))
-
-        # Pretty text: preserve line structure
-        text_pretty = soup.get_text(separator="\n")
-        lines = [ln.strip() for ln in text_pretty.splitlines() if ln.strip()]
-        text_pretty = "\n".join(lines)
+        # Convert to normalized and pretty (line-structured) formats
+        text_normalized, text_pretty = _ruling_html_texts(raw_text)
 
         # Cache results
-        with open(cache_txt_path, "w", encoding="utf-8") as f:
-            f.write(text_normalized)
-        with open(cache_pretty_path, "w", encoding="utf-8") as f:
-            f.write(text_pretty)
+        _write_text_caches(cache_txt_path, cache_pretty_path, text_normalized, text_pretty)
+        _remember_texts(memo_key, text_normalized, text_pretty)
 
         return (
             text_normalized,
             text_pretty,
-            {"source": "tier_1_json_api", "cached": False, "api_url": api_url}
+            {"source": "tier_1_json_api", "cached": raw_cached, "api_url": api_url}
         )
 
     except Exception as e:
@@ -124,6 +188,32 @@ def fetch_tier_1(ruling_id: str, cache_dir: str) -> Tuple[str, str, Dict]:
 # TIER 2: HTML PAGE
 # =========================
 
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _embedded_ruling_text(script: str) -> Optional[str]:
+    """
+    Return the rulingText of the JSON object embedded in a <script>, or None.
+
+    Starts at the "rulingText" key and walks back through the preceding "{"s,
+    decoding exactly one object from each (raw_decode stops at its closing
+    brace) until one has a non-empty top-level rulingText. Code after the
+    object is never scanned or copied.
+    """
+    key = script.find('"rulingText"')
+    start = script.rfind("{", 0, key) if key >= 0 else -1
+    while start >= 0:
+        try:
+            payload, _ = _JSON_DECODER.raw_decode(script, start)
+        except ValueError:
+            pass
+        else:
+            if isinstance(payload, dict) and payload.get("rulingText"):
+                return payload["rulingText"]
+        start = script.rfind("{", 0, start)
+    return None
+
+
 def fetch_tier_2(ruling_id: str, cache_dir: str) -> Tuple[str, str, Dict]:
     """
     Fetch ruling text from public HTML page.
@@ -141,9 +231,16 @@ def fetch_tier_2(ruling_id: str, cache_dir: str) -> Tuple[str, str, Dict]:
     Raises:
         RuntimeError: If page fetch fails or contains no usable text
     """
-    ensure_dir(cache_dir)
     ruling_id = ruling_id.strip().upper()
 
+    # Already loaded in this process
+    memo_key = (2, ruling_id, cache_dir)
+    memo = _TEXT_MEMO.get(memo_key)
+    if memo is not None:
+        return memo[0], memo[1], {"source": "tier_2_html_page", "cached": True}
+
+    ensure_dir(cache_dir)
+
     # Cache paths specific to tier 2
     cache_html_path = os.path.join(cache_dir, f"{ruling_id}.tier2.html")
     cache_txt_path = os.path.join(cache_dir, f"{ruling_id}.tier2.normalized.txt")
@@ -151,67 +248,52 @@ def fetch_tier_2(ruling_id: str, cache_dir: str) -> Tuple[str, str, Dict]:
 
     # Return cached if available
     if os.path.exists(cache_txt_path) and os.path.exists(cache_pretty_path):
-        return (
-            read_text(cache_txt_path),
-            read_text(cache_pretty_path),
-            {"source": "tier_2_html_page", "cached": True}
-        )
+        text_normalized = read_text(cache_txt_path)
+        text_pretty = read_text(cache_pretty_path)
+        _remember_texts(memo_key, text_normalized, text_pretty)
+        return text_normalized, text_pretty, {"source": "tier_2_html_page", "cached": True}
 
     # Fetch HTML page
     page_url = f"https://rulings.cbp.gov/ruling/{ruling_id}"
     headers = {"User-Agent": "Mozilla/5.0"}
 
     try:
-        response = requests.get(page_url, headers=headers, timeout=20)
-        response.raise_for_status()
-        html_content = response.text
+        raw_cached = os.path.exists(cache_html_path)
+        if raw_cached:
+            # Raw page already on disk: rebuild the texts without a network call
+            html_content = read_text(cache_html_path)
+        else:
+            response = _SESSION.get(page_url, headers=headers, timeout=20)
+            response.raise_for_status()
+            html_content = response.text
 
-        # Save raw HTML
-        with open(cache_html_path, "w", encoding="utf-8") as f:
-            f.write(html_content)
+            # Save raw HTML
+            _atomic_write(cache_html_path, html_content)
 
-        soup = BeautifulSoup(html_content, "html.parser")
+        page = _collect_text(html_content)
 
         # Try to extract rulingText from embedded JSON in script tags (fallback)
         ruling_text_from_script = None
-        for script in soup.find_all("script"):
-            if script.string and "rulingText" in script.string:
-                try:
-                    json_match = re.search(r'\{.*"rulingText".*\}', script.string, re.DOTALL)
-                    if json_match:
-                        payload = json.loads(json_match.group(0))
-                        if isinstance(payload, dict) and payload.get("rulingText"):
-                            ruling_text_from_script = payload["rulingText"]
-                            break
-                except Exception:
-                    pass
+        for script in page.scripts:
+            if "rulingText" in script:
+                ruling_text_from_script = _embedded_ruling_text(script)
+                if ruling_text_from_script:
+                    break
 
         # If we found embedded JSON, use it; otherwise use full page HTML
         if ruling_text_from_script:
-            soup = BeautifulSoup(ruling_text_from_script, "html.parser")
-
-        # Remove non-visible elements
-        for tag in soup(["script", "style", "noscript"]):
-            tag.decompose()
-
-        # Normalized text
-        text_normalized = normalize_text(soup.get_text("\n"))
-
-        # Pretty text: preserve structure
-        text_pretty = soup.get_text(separator="\n")
-        lines = [ln.strip() for ln in text_pretty.splitlines() if ln.strip()]
-        text_pretty = "\n".join(lines)
+            text_normalized, text_pretty = _ruling_html_texts(ruling_text_from_script)
+        else:
+            text_normalized, text_pretty = _text_variants("\n".join(page.strings))
 
         # Cache results
-        with open(cache_txt_path, "w", encoding="utf-8") as f:
-            f.write(text_normalized)
-        with open(cache_pretty_path, "w", encoding="utf-8") as f:
-            f.write(text_pretty)
+        _write_text_caches(cache_txt_path, cache_pretty_path, text_normalized, text_pretty)
+        _remember_texts(memo_key, text_normalized, text_pretty)
 
         return (
             text_normalized,
             text_pretty,
-            {"source": "tier_2_html_page", "cached": False, "page_url": page_url}
+            {"source": "tier_2_html_page", "cached": raw_cached, "page_url": page_url}
         )
 
     except Exception as e:
@@ -222,50 +304,593 @@ def fetch_tier_2(ruling_id: str, cache_dir: str) -> Tuple[str, str, Dict]:
 # TIER 3: DOCUMENT DOWNLOAD (Refactored from cbp_download.py)
 # =========================
 
+def _extract_text_from_cfb_doc_with_antiword(doc_path: str) -> Optional[str]:
+    """
+    Extract a legacy .doc (CFB) with the `antiword` command-line tool, if installed.
+
+    Runs as a short-lived subprocess instead of starting Word over COM for
+    every document, and works off Windows. Returns None when antiword is not
+    on PATH or cannot read the file, so the caller can fall back to Word.
+    """
+    antiword = shutil.which("antiword")
+    if antiword is None:
+        return None
+    # -w 0: one line per paragraph (no re-wrapping); -m UTF-8.txt: UTF-8 output
+    try:
+        proc = subprocess.run(
+            [antiword, "-w", "0", "-m", "UTF-8.txt", doc_path],
+            capture_output=True,
+            timeout=60,
+        )
+    except (subprocess.TimeoutExpired, OSError):
+        return None  # hung, or the binary cannot be executed
+    if proc.returncode != 0:
+        return None
+    return proc.stdout.decode("utf-8", errors="ignore")
+
+
+def _extract_text_from_cfb_doc(doc_path: str) -> str:
+    """Text of a legacy .doc (CFB): antiword when available, else Word COM."""
+    text = _extract_text_from_cfb_doc_with_antiword(doc_path)
+    if text is None:
+        text = _extract_text_from_cfb_doc_with_word(doc_path)
+    return text
+
+
+# One Word instance for the whole process, started on first use and quit at
+# exit. Tier-3 fetches run on worker threads, so COM is joined in the
+# multithreaded apartment (MTA) on each thread that touches Word: an MTA proxy
+# can be called from any MTA thread, whereas an STA proxy is bound to the
+# thread that created it. Word itself handles one document at a time.
+_WORD_APP = None
+_WORD_LOCK = threading.Lock()
+_COM_THREAD = threading.local()
+
+
+def _com_init_mta() -> None:
+    """Join this thread to the COM multithreaded apartment (once per thread)."""
+    if not getattr(_COM_THREAD, "initialized", False):
+        # The first import of pythoncom initializes COM on the importing
+        # thread in the apartment named by sys.coinit_flags (STA by default);
+        # CoInitializeEx(MTA) on that thread would then fail with
+        # RPC_E_CHANGED_MODE. Ask for the MTA before that import happens.
+        sys.coinit_flags = 0  # COINIT_MULTITHREADED
+        import pythoncom  # type: ignore
+
+        pythoncom.CoInitializeEx(pythoncom.COINIT_MULTITHREADED)
+        _COM_THREAD.initialized = True
+
+
+def _quit_word() -> None:
+    """atexit hook: quit the shared Word instance from a fresh MTA thread."""
+    def _quit():
+        _com_init_mta()
+        try:
+            _WORD_APP.Quit()
+        except Exception:
+            pass  # Word already gone (closed by the user or crashed)
+
+    if _WORD_APP is not None:
+        # The main thread may be in an STA, where the MTA proxy is unusable
+        t = threading.Thread(target=_quit)
+        t.start()
+        t.join()
+
+
+atexit.register(_quit_word)
+
+
+# COM errors meaning the Word process itself is gone (closed or crashed), as
+# opposed to Word failing to open one document:
+# RPC_E_DISCONNECTED, RPC_S_SERVER_UNAVAILABLE
+_WORD_GONE_HRESULTS = frozenset((-2147417848, -2147023174))
+
+
+def _discard_word() -> None:
+    """Quit the shared Word instance if it still answers, then forget it. Caller holds _WORD_LOCK."""
+    global _WORD_APP
+    word, _WORD_APP = _WORD_APP, None
+    if word is not None:
+        try:
+            word.Quit()
+        except Exception:
+            pass  # already gone
+
+
+def _word_app():
+    """Return the shared Word.Application, starting it on first call. Caller holds _WORD_LOCK."""
+    global _WORD_APP
+    if _WORD_APP is None:
+        import win32com.client  # type: ignore
+
+        _WORD_APP = win32com.client.DispatchEx("Word.Application")
+        _WORD_APP.Visible = False
+    return _WORD_APP
+
+
 def _extract_text_from_cfb_doc_with_word(doc_path: str) -> str:
     """
     Use Microsoft Word (COM) to open a legacy .doc (CFB) and return text.
     Requires Windows + Word installed + pywin32.
+
+    Reuses one Word instance across calls instead of paying Word startup per
+    document. If that instance has died (a COM disconnect), it is quit,
+    restarted once and the document retried. Any other error opening the
+    document (corrupt, password-protected, ...) is raised with Word left
+    running for the next document.
     """
     try:
-        import win32com.client  # type: ignore
+        _com_init_mta()  # before win32com, which imports pythoncom
+        import pywintypes  # type: ignore
+        import win32com.client  # type: ignore  # noqa: F401
     except ImportError as e:
         raise RuntimeError("pywin32 is required: python -m pip install pywin32") from e
 
-    word = win32com.client.DispatchEx("Word.Application")
-    word.Visible = False
+    path = os.path.abspath(doc_path)
+    with _WORD_LOCK:
+        for attempt in range(2):
+            word = _word_app()
+            try:
+                doc = word.Documents.Open(path, ReadOnly=True)
+            except pywintypes.com_error as e:
+                if attempt or e.args[0] not in _WORD_GONE_HRESULTS:
+                    raise
+                # Stale instance (Word was closed or crashed): start a new one
+                _discard_word()
+                continue
+            try:
+                return doc.Content.Text or ""
+            finally:
+                doc.Close(False)
+
+
+# Text nodes made only of ASCII whitespace (the runs between tags)
+_ASCII_WS_RE = re.compile(r"[ \t\n\r\f]*\Z")
+
+# Word field-code artifacts left in the .doc HTML ("PAGE \* MERGEFORMAT 2")
+_MERGEFORMAT_RE1 = re.compile(r"PAGE\s*\\\*\s*MERGEFORMAT\s*\d*", re.IGNORECASE)
+_MERGEFORMAT_RE2 = re.compile(r"\\\*\s*MERGEFORMAT\s*\d*", re.IGNORECASE)
+
+
+def _tree_text(root) -> str:
+    """
+    Return a parsed document's text nodes joined with "\n", skipping script/style/noscript.
+
+    Used for tier-3 documents, which were read with BeautifulSoup's lxml
+    builder: walking the lxml tree directly is ~10x faster and gives the same
+    text on the cached CBP documents (comments excluded, tails after removed
+    tags kept, whitespace-only nodes collapsed to "\n" or " " as bs4 stores
+    them). Heavily misnested markup can still split text nodes differently
+    from bs4's builder. Removes the skipped elements from `root` in place.
+    """
+    etree.strip_elements(root, "script", "style", "noscript", with_tail=False)
+    return "\n".join(
+        ("\n" if "\n" in t else " ") if _ASCII_WS_RE.match(t) else t
+        for t in root.itertext()
+    )
+
+
+# Leading XML declaration (optionally after a BOM/whitespace), e.g. Word's
+# '<?xml version="1.0" encoding="windows-1252"?>'
+_XML_DECL_RE = re.compile(r"^[\s\ufeff]*<\?xml[^>]*>", re.IGNORECASE)
+
+
+def _html_text(html: str) -> str:
+    """Parse `html` with lxml and return its visible text (see `_tree_text`)."""
+    if not html.strip():
+        return ""
     try:
-        doc = word.Documents.Open(os.path.abspath(doc_path), ReadOnly=True)
+        root = lxml.html.document_fromstring(html)
+    except ValueError:
+        # lxml refuses str input that declares an encoding; the text is
+        # already decoded, so the declaration carries nothing: drop it
+        if not _XML_DECL_RE.match(html):
+            raise
+        return _html_text(_XML_DECL_RE.sub("", html, count=1))
+    except etree.ParserError:
+        return ""  # nothing but comments/whitespace ("Document is empty")
+    return _tree_text(root)
+
+
+# Elements whose strings BeautifulSoup's get_text() leaves out: script/style/
+# noscript (decomposed before get_text) and the string containers it types
+# separately (template, rt, rp)
+_HIDDEN_TAGS = frozenset(("script", "style", "noscript", "template", "rt", "rp"))
+_PRESERVE_WS_TAGS = frozenset(("pre", "textarea"))
+# Void elements: never pushed on the open-element stack
+_VOID_TAGS = frozenset((
+    "area", "base", "br", "col", "embed", "hr", "img", "input", "keygen", "link", "menuitem",
+    "meta", "param", "source", "track", "wbr", "basefont", "bgsound", "command", "frame",
+    "image", "isindex", "nextid", "spacer",
+))
+
+
+class _TextCollector(HTMLParser):
+    """
+    Collect the strings BeautifulSoup(html, "html.parser").get_text("\n") joins.
+
+    Tier-1/2 rulingText used html.parser via bs4, and lxml recovers from the
+    misnested Word markup (and rewrites CRLF) differently, which changes line
+    breaks. This drives the same stdlib parser without building bs4's tree
+    (~4x faster): a string ends at every tag/comment event, whitespace-only
+    strings collapse to "\n" or " " outside <pre>/<textarea>, and an end tag
+    closes everything opened after its start tag. Only malformed character
+    references (unknown names, or left in unterminated markup at the end)
+    decode differently: they follow HTML5 here.
+
+    Script contents are also kept, in `scripts`, for tier 2's embedded JSON.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.strings: List[str] = []
+        self.scripts: List[str] = []
+        self._data: List[str] = []
+        self._open: List[str] = []
+        self._hidden = 0
+        self._preserve = 0
+
+    def _end_string(self) -> None:
+        if not self._data:
+            return
+        s = "".join(self._data)
+        self._data = []
+        if self._open and self._open[-1] == "script":
+            self.scripts.append(s)
+        if self._hidden:
+            return
+        if not self._preserve and _ASCII_WS_RE.match(s):
+            s = "\n" if "\n" in s else " "
+        self.strings.append(s)
+
+    def handle_starttag(self, tag, attrs):
+        self._end_string()
+        if tag not in _VOID_TAGS:
+            self._open.append(tag)
+            self._hidden += tag in _HIDDEN_TAGS
+            self._preserve += tag in _PRESERVE_WS_TAGS
+
+    def handle_startendtag(self, tag, attrs):
+        self._end_string()
+
+    def handle_endtag(self, tag):
+        self._end_string()
+        if tag in self._open:
+            while True:
+                name = self._open.pop()
+                self._hidden -= name in _HIDDEN_TAGS
+                self._preserve -= name in _PRESERVE_WS_TAGS
+                if name == tag:
+                    break
+
+    def handle_data(self, data):
+        self._data.append(data)
+
+    def handle_comment(self, data):
+        self._end_string()
+
+    def handle_decl(self, decl):
+        self._end_string()
+
+    def handle_pi(self, data):
+        self._end_string()
+
+    def unknown_decl(self, data):
+        self._end_string()
+        if data.upper().startswith("CDATA["):
+            self._data.append(data[6:])
+            self._end_string()
+
+    def close(self):
+        super().close()
+        self._end_string()
+
+
+def _collect_text(html: str) -> _TextCollector:
+    """Run `html` through a `_TextCollector` and return it."""
+    collector = _TextCollector()
+    collector.feed(html)
+    collector.close()
+    return collector
+
+
+def _pretty_lines(text: str) -> str:
+    """Non-blank lines of `text`, stripped, joined with "\n" (each line is stripped once)."""
+    return "\n".join(filter(None, map(str.strip, text.splitlines())))
+
+
+def _text_variants(text: str) -> Tuple[str, str]:
+    """
+    (normalized, pretty) from one extracted text.
+
+    Both variants come from the same tree walk; they are not derived from each
+    other because normalize_text keeps paragraph breaks that pretty drops.
+    """
+    return normalize_text(text), _pretty_lines(text)
+
+
+# (normalized, pretty) per rulingText fragment, keyed by a digest of its content
+# rather than the ruling id; see _ruling_html_texts.
+_RULING_HTML_MEMO: Dict[bytes, Tuple[str, str]] = {}
+_RULING_HTML_MEMO_MAX = 256
+
+
+def _ruling_html_texts(html: str) -> Tuple[str, str]:
+    """
+    (normalized, pretty) for a tier-1/2 rulingText fragment, memoized by content.
+
+    The API (tier 1) and the page's embedded JSON (tier 2) normally carry the
+    same rulingText, so the fetchers report would otherwise parse each ruling
+    twice. Keyed by a 128-bit BLAKE2 digest so the HTML itself is not kept.
+    """
+    key = hashlib.blake2b(html.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+    texts = _RULING_HTML_MEMO.get(key)
+    if texts is None:
+        texts = _text_variants("\n".join(_collect_text(html).strings))
+        with _MEMO_LOCK:
+            if key not in _RULING_HTML_MEMO and len(_RULING_HTML_MEMO) >= _RULING_HTML_MEMO_MAX:
+                _RULING_HTML_MEMO.pop(next(iter(_RULING_HTML_MEMO)))
+            _RULING_HTML_MEMO[key] = texts
+    return texts
+
+
+def _html_to_texts(html: str) -> Tuple[str, str]:
+    """Convert .doc HTML to (normalized, pretty) text from a single parse."""
+    text = _html_text(html)
+    # Remove Word field-code artifacts (pretty text only). Both patterns need
+    # a literal "\*", so a plain substring scan skips them on most rulings.
+    pretty = text
+    if "\\*" in pretty:
+        pretty = _MERGEFORMAT_RE1.sub("", pretty)
+        pretty = _MERGEFORMAT_RE2.sub("", pretty)
+    return normalize_text(text), _pretty_lines(pretty)
+
+
+# Bytes needed to tell a ruling document's format from its first bytes
+_SNIFF_BYTES = 256
+_CFB_MAGIC = b"\xD0\xCF\x11\xE0\xA1\xB1\x1A\xE1"
+
+# Pages of a PDF ruling to extract. Rulings run to a few pages; the cap only
+# bounds the cost of an oversized or scanned PDF served in a ruling's place.
+MAX_PDF_PAGES = 500
+
+
+def _sniff_document(head: bytes) -> Optional[str]:
+    """Return "pdf", "cfb" or "html" from a document's leading bytes, or None if unrecognized."""
+    if head[:4] == b"%PDF":
+        return "pdf"
+    if head[:8] == _CFB_MAGIC:
+        return "cfb"
+    start = head[:200].lower()
+    if b"<html" in start or b"<!doctype" in start:
+        return "html"
+    return None
+
+
+def _document_to_texts(
+    ruling_id: str,
+    data: Union[bytes, bytearray],
+    cache_dir: str,
+    save_raw: bool = True,
+    raw_written: bool = False,
+) -> Tuple[str, str]:
+    """
+    Detect the format of a ruling document and convert it to (normalized, pretty) text.
+
+    Handles PDF, legacy binary .doc (CFB, via antiword or Word COM) and
+    HTML-flavored .doc.
+    Raw artifacts are written to cache_dir when `save_raw` is True; pass False
+    when `data` was itself read back from those cache files. `raw_written`
+    means the caller already saved `data` as raw.pdf/raw.doc (see
+    _download_document), so only derived artifacts (raw.html) are written.
+
+    Raises:
+        RuntimeError: If the bytes are not a recognized document format
+    """
+    cache_raw_doc_path = os.path.join(cache_dir, f"{ruling_id}.raw.doc")
+    cache_raw_pdf_path = os.path.join(cache_dir, f"{ruling_id}.raw.pdf")
+    cache_html_path = os.path.join(cache_dir, f"{ruling_id}.raw.html")
+
+    # Detect file type
+    kind = _sniff_document(data[:_SNIFF_BYTES])
+
+    if kind == "pdf":
+        # Save raw PDF
+        if save_raw and not raw_written:
+            _atomic_write(cache_raw_pdf_path, data)
+
+        # Extract text from PDF (pypdf is imported on first PDF; most rulings are HTML)
+        from pypdf import PdfReader
+
+        pdf_reader = PdfReader(io.BytesIO(data))
+        pages = islice(pdf_reader.pages, MAX_PDF_PAGES)
+        text = "\n\n".join(page.extract_text() or "" for page in pages)
+        text_normalized = normalize_text(text)
+        text_pretty = text  # PDF extraction doesn't have clean line structure
+
+    elif kind == "cfb":
+        # Real legacy .doc file - antiword or Word COM (both read it from disk)
+        if (save_raw and not raw_written) or not os.path.exists(cache_raw_doc_path):
+            _atomic_write(cache_raw_doc_path, data)
+        text = _extract_text_from_cfb_doc(cache_raw_doc_path)
+        text_normalized = normalize_text(text)
+        text_pretty = text
+
+    elif kind == "html":
+        # HTML-based .doc (most common). Decode and parse once; both text
+        # variants (and the raw.html copy) come from the same string.
         try:
-            return doc.Content.Text or ""
+            html = data.decode("utf-8")
+            lossless = True
+        except UnicodeDecodeError:
+            html = data.decode("utf-8", errors="ignore")
+            lossless = False
+        if save_raw:
+            if not raw_written:
+                _atomic_write(cache_raw_doc_path, data)
+            # raw.html is the decoded text written in text mode. If decoding
+            # dropped nothing and text mode does no newline translation
+            # (POSIX), its bytes are exactly raw.doc's: link instead of copying.
+            if not (lossless and os.linesep == "\n" and _link_copy(cache_raw_doc_path, cache_html_path)):
+                _atomic_write(cache_html_path, html)
+
+        text_normalized, text_pretty = _html_to_texts(html)
+
+    else:
+        raise RuntimeError(f"Unknown file format for {ruling_id}")
+
+    return text_normalized, text_pretty
+
+
+# One os.scandir listing per cache directory, so cache hits need no per-file
+# stat calls. Names missing from the listing are re-checked on disk, since
+# files may have been written after it was taken.
+_CACHE_LISTINGS: Dict[str, set] = {}
+
+
+def _cache_listing(cache_dir: str) -> set:
+    listing = _CACHE_LISTINGS.get(cache_dir)
+    if listing is None:
+        with os.scandir(cache_dir) as it:
+            listing = {entry.name for entry in it}
+        _CACHE_LISTINGS[cache_dir] = listing
+    return listing
+
+
+def _tmp_path(path: str) -> str:
+    """Per-process/thread temp name next to `path`, for write-then-os.replace."""
+    return f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+
+
+def _atomic_write(path: str, data: Union[str, bytes, bytearray]) -> None:
+    """
+    Write `data` (str as UTF-8 text mode, bytes as-is) to a temp file, then os.replace it in.
+
+    Cache files are trusted on existence alone, so a crash mid-write must
+    never leave a partial file under the final name.
+    """
+    tmp = _tmp_path(path)
+    if isinstance(data, str):
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(data)
+    else:
+        with open(tmp, "wb") as f:
+            f.write(data)
+    os.replace(tmp, path)
+
+
+def _link_copy(src_path: str, dst_path: str) -> bool:
+    """
+    Make `dst_path` a hard link to `src_path` instead of writing a second copy.
+
+    The link is swapped in with os.replace, so an existing `dst_path` (possibly
+    itself a link) is replaced rather than written through. Returns False when
+    the filesystem refuses hard links; the caller then writes a normal copy.
+    """
+    tmp = _tmp_path(dst_path)
+    try:
+        os.link(src_path, tmp)
+    except OSError:
+        return False
+    os.replace(tmp, dst_path)
+    return True
+
+
+def _write_text_caches(txt_path: str, pretty_path: str, text_normalized: str, text_pretty: str) -> None:
+    """
+    Write the normalized/pretty text caches for one ruling.
+
+    When the two texts are identical (e.g. PDF or legacy .doc text that needed
+    no normalization), the pretty file is a hard link to the normalized one
+    rather than a second copy. Each name is swapped in with os.replace, so a
+    later rewrite of one file never writes through a shared link.
+    """
+    _atomic_write(txt_path, text_normalized)
+    if text_pretty == text_normalized and _link_copy(txt_path, pretty_path):
+        return
+    _atomic_write(pretty_path, text_pretty)
+
+
+def _download_document(head: bytes, chunks, raw_path: str) -> bytearray:
+    """
+    Drain a streamed response body into `raw_path` and return the full payload.
+
+    Each chunk is written to disk as it arrives, so saving the raw document
+    overlaps the download instead of following it, and the payload is held
+    once (in a bytearray) rather than as a chunk list plus its join. The file
+    only appears under `raw_path` once the body is complete.
+    """
+    data = bytearray(head)
+    tmp = _tmp_path(raw_path)
+    try:
+        with open(tmp, "wb") as f:
+            f.write(head)
+            for chunk in chunks:
+                f.write(chunk)
+                data += chunk
+        os.replace(tmp, raw_path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+    return data
+
+
+# Year probes for all tier-3 rulings share one small pool, so concurrent
+# fetch workers put at most _PROBE_WORKERS HEADs in flight at the CBP host
+# (instead of every year of every ruling at once). Each ruling probes its
+# years in waves of _PROBE_WAVE, in YEAR_CANDIDATES order, and stops at the
+# first wave that finds the document.
+_PROBE_WORKERS = 8
+_PROBE_WAVE = 4
+_PROBE_POOL = ThreadPoolExecutor(max_workers=_PROBE_WORKERS, thread_name_prefix="year-probe")
+
+# Probes run on their own session, one connection per probe worker: a probe
+# left running after its ruling found a 200 never holds a connection the
+# winning GET on _SESSION is waiting for. Probes are short and not retried;
+# a failed probe just keeps its year in the GET list (which does retry).
+_PROBE_SESSION = requests.Session()
+_PROBE_SESSION.headers.update(_SESSION.headers)
+_PROBE_SESSION.mount(
+    "https://",
+    HTTPAdapter(pool_connections=1, pool_maxsize=_PROBE_WORKERS, max_retries=0),
+)
+
+
+def _probe_candidates(candidates: List[Tuple[int, str]]) -> List[Tuple[int, str]]:
+    """
+    HEAD the candidate URLs (a few at a time) and return the ones still worth a GET.
+
+    Candidates that answer 404 are dropped; the list is cut after the first 200,
+    so the earliest matching year (in YEAR_CANDIDATES order) wins, as with the
+    sequential loop. Anything else (405 for HEAD, 5xx, network error) is kept,
+    so servers without HEAD support degrade to the plain GET-per-year loop.
+    """
+    def _head(url: str) -> Optional[int]:
+        try:
+            return _PROBE_SESSION.head(url, timeout=10, allow_redirects=True).status_code
+        except requests.RequestException:
+            return None
+
+    remaining = []
+    for start in range(0, len(candidates), _PROBE_WAVE):
+        wave = candidates[start:start + _PROBE_WAVE]
+        futures = [_PROBE_POOL.submit(_head, url) for _, url in wave]
+        try:
+            # Statuses are read in candidate order, so the wave stops at its
+            # first 200 without waiting on later (slower) years.
+            for candidate, future in zip(wave, futures):
+                status = future.result()
+                if status == 404:
+                    continue
+                remaining.append(candidate)
+                if status == 200:
+                    return remaining
         finally:
-            doc.Close(False)
-    finally:
-        word.Quit()
-
-
-def _doc_bytes_to_text(doc_bytes: bytes) -> str:
-    """Convert CBP .doc bytes (usually HTML) to normalized text."""
-    html = doc_bytes.decode("utf-8", errors="ignore")
-    soup = BeautifulSoup(html, "lxml")
-    for tag in soup(["script", "style", "noscript"]):
-        tag.decompose()
-    text = soup.get_text("\n")
-    return normalize_text(text)
-
-
-def _doc_bytes_to_pretty_text(doc_bytes: bytes) -> str:
-    """Convert CBP .doc bytes to pretty (line-structured) text."""
-    html = doc_bytes.decode("utf-8", errors="ignore")
-    soup = BeautifulSoup(html, "lxml")
-    for tag in soup(["script", "style", "noscript"]):
-        tag.decompose()
-    text = soup.get_text(separator="\n")
-    # Remove Word field-code artifacts
-    text = re.sub(r"PAGE\s*\\\*\s*MERGEFORMAT\s*\d*", "", text, flags=re.IGNORECASE)
-    text = re.sub(r"\\\*\s*MERGEFORMAT\s*\d*", "", text, flags=re.IGNORECASE)
-    lines = [ln.strip() for ln in text.splitlines() if ln.strip()]
-    return "\n".join(lines)
+            # Probes not started yet are dropped rather than sent
+            for future in futures:
+                future.cancel()
+    return remaining
 
 
 def fetch_tier_3(ruling_id: str, cache_dir: str, jurisdiction: str = "ny") -> Tuple[str, str, Dict]:
@@ -285,82 +910,106 @@ def fetch_tier_3(ruling_id: str, cache_dir: str, jurisdiction: str = "ny") -> Tu
     Raises:
         RuntimeError: If document cannot be found in any candidate year
     """
-    ensure_dir(cache_dir)
     ruling_id = ruling_id.strip().upper()
 
+    # Already loaded in this process
+    memo_key = (3, ruling_id, cache_dir)
+    memo = _TEXT_MEMO.get(memo_key)
+    if memo is not None:
+        return memo[0], memo[1], {"source": "tier_3_document_download", "cached": True}
+
+    # One fetch per ruling at a time: a concurrent caller for the same ruling
+    # waits here, then finds the texts memoized instead of downloading again
+    # and racing to replace the same cache files.
+    with _fetch_lock(memo_key):
+        memo = _TEXT_MEMO.get(memo_key)
+        if memo is not None:
+            return memo[0], memo[1], {"source": "tier_3_document_download", "cached": True}
+        return _fetch_tier_3(ruling_id, cache_dir, jurisdiction, memo_key)
+
+
+def _fetch_tier_3(ruling_id: str, cache_dir: str, jurisdiction: str, memo_key: Tuple[int, str, str]) -> Tuple[str, str, Dict]:
+    """fetch_tier_3 past the memo: disk cache, raw-document re-conversion, then download."""
+    ensure_dir(cache_dir)
+
     # Cache paths (keep same naming as original for compatibility)
-    cache_txt_path = os.path.join(cache_dir, f"{ruling_id}.normalized.txt")
-    cache_pretty_path = os.path.join(cache_dir, f"{ruling_id}.pretty.txt")
+    txt_name = f"{ruling_id}.normalized.txt"
+    pretty_name = f"{ruling_id}.pretty.txt"
+    cache_txt_path = os.path.join(cache_dir, txt_name)
+    cache_pretty_path = os.path.join(cache_dir, pretty_name)
     cache_raw_doc_path = os.path.join(cache_dir, f"{ruling_id}.raw.doc")
     cache_raw_pdf_path = os.path.join(cache_dir, f"{ruling_id}.raw.pdf")
     cache_html_path = os.path.join(cache_dir, f"{ruling_id}.raw.html")
 
     # Return cached if available
-    if os.path.exists(cache_txt_path) and os.path.exists(cache_pretty_path):
-        return (
-            read_text(cache_txt_path),
-            read_text(cache_pretty_path),
-            {"source": "tier_3_document_download", "cached": True}
-        )
-
-    headers = {"User-Agent": "Mozilla/5.0"}
-    last_404_url = None
-
-    # Try each year until document is found
-    for year in YEAR_CANDIDATES:
-        url = DOC_URL_TEMPLATE.format(jurisdiction=jurisdiction, year=year, ruling_id=ruling_id)
-        r = requests.get(url, headers=headers, timeout=60)
-
-        if r.status_code == 404:
-            last_404_url = url
-            continue
-
-        r.raise_for_status()
-        data = r.content
-
-        # Detect file type
-        head8 = data[:8]
-        is_pdf = data[:4] == b"%PDF"
-        is_cfb = head8 == b"\xD0\xCF\x11\xE0\xA1\xB1\x1A\xE1"
-        looks_like_html = (b"<html" in data[:200].lower() or b"<!doctype" in data[:200].lower())
-
-        if is_pdf:
-            # Save raw PDF
-            with open(cache_raw_pdf_path, "wb") as f:
-                f.write(data)
-
-            # Extract text from PDF
-            pdf_reader = PdfReader(io.BytesIO(data))
-            text = "\n\n".join(page.extract_text() or "" for page in pdf_reader.pages)
-            text_normalized = normalize_text(text)
-            text_pretty = text  # PDF extraction doesn't have clean line structure
-
-        elif is_cfb:
-            # Real legacy .doc file - requires Word COM
-            with open(cache_raw_doc_path, "wb") as f:
-                f.write(data)
-            text = _extract_text_from_cfb_doc_with_word(cache_raw_doc_path)
-            text_normalized = normalize_text(text)
-            text_pretty = text
-
-        elif looks_like_html:
-            # HTML-based .doc (most common)
-            with open(cache_raw_doc_path, "wb") as f:
-                f.write(data)
-            with open(cache_html_path, "w", encoding="utf-8", errors="ignore") as f:
-                f.write(data.decode("utf-8", errors="ignore"))
-
-            text_normalized = _doc_bytes_to_text(data)
-            text_pretty = _doc_bytes_to_pretty_text(data)
-
+    listing = _cache_listing(cache_dir)
+    if (txt_name in listing and pretty_name in listing) or (
+        os.path.exists(cache_txt_path) and os.path.exists(cache_pretty_path)
+    ):
+        try:
+            text_normalized = read_text(cache_txt_path)
+            text_pretty = read_text(cache_pretty_path)
+        except FileNotFoundError:
+            # Listing is stale (cache cleared since it was taken): rebuild below
+            listing.discard(txt_name)
+            listing.discard(pretty_name)
         else:
-            raise RuntimeError(f"Unknown file format for {ruling_id}")
+            _remember_texts(memo_key, text_normalized, text_pretty)
+            return (
+                text_normalized,
+                text_pretty,
+                {"source": "tier_3_document_download", "cached": True}
+            )
+
+    # Raw document already downloaded (text caches cleared, or an earlier run
+    # stopped before writing them): convert it again instead of re-downloading.
+    for raw_path in (cache_raw_pdf_path, cache_raw_doc_path, cache_html_path):
+        if os.path.exists(raw_path):
+            with open(raw_path, "rb") as f:
+                data = f.read()
+            text_normalized, text_pretty = _document_to_texts(ruling_id, data, cache_dir, save_raw=False)
+
+            _write_text_caches(cache_txt_path, cache_pretty_path, text_normalized, text_pretty)
+            _remember_texts(memo_key, text_normalized, text_pretty)
+
+            return (
+                text_normalized,
+                text_pretty,
+                {"source": "tier_3_document_download", "cached": True, "raw_path": raw_path}
+            )
+
+    candidates = build_candidate_urls(ruling_id, jurisdiction)
+    last_404_url = candidates[-1][1] if candidates else None
+
+    # Probe the years with HEAD, then GET only the likely match
+    # (instead of one full GET round-trip per wrong year)
+    for year, url in _probe_candidates(candidates):
+        with _SESSION.get(url, timeout=60, stream=True) as r:
+            if r.status_code == 404:
+                last_404_url = url
+                continue
+
+            r.raise_for_status()
+
+            # Sniff the format from the first bytes before pulling the rest of
+            # the body, so a non-document response is rejected after one chunk.
+            chunks = r.iter_content(chunk_size=64 * 1024)
+            head = b""
+            for chunk in chunks:
+                head += chunk
+                if len(head) >= _SNIFF_BYTES:
+                    break
+            kind = _sniff_document(head)
+            if kind is None:
+                raise RuntimeError(f"Unknown file format for {ruling_id}")
+            raw_path = cache_raw_pdf_path if kind == "pdf" else cache_raw_doc_path
+            data = _download_document(head, chunks, raw_path)
+
+        text_normalized, text_pretty = _document_to_texts(ruling_id, data, cache_dir, raw_written=True)
 
         # Cache results
-        with open(cache_txt_path, "w", encoding="utf-8") as f:
-            f.write(text_normalized)
-        with open(cache_pretty_path, "w", encoding="utf-8") as f:
-            f.write(text_pretty)
+        _write_text_caches(cache_txt_path, cache_pretty_path, text_normalized, text_pretty)
+        _remember_texts(memo_key, text_normalized, text_pretty)
 
         return (
             text_normalized,
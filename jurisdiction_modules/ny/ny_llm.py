@@ -18,35 +18,183 @@ Flexible: Defaults to OpenAI gpt-5-nano. Override with provider/model parameters
 import re
 import os
 import json
+import hashlib
+import threading
 import requests
-from typing import Optional
+from requests.adapters import HTTPAdapter
+from typing import List, Optional, Tuple, Union
+from urllib3.util.retry import Retry
 
 
 from shared_modules.llm_config import PROVIDERS
+from shared_modules.utils import ensure_dir, json_loads, load_json_if_exists, write_json
+
+
+# Precompiled patterns for defensive response parsing
+_FENCE_HEAD_RE = re.compile(r"^```(?:json)?\s*", re.IGNORECASE)
+_FENCE_TAIL_RE = re.compile(r"\s*```$")
+_JSON_OBJ_RE = re.compile(r"\{.*\}", re.DOTALL)
+
+
+# Standard CBP legal boilerplate paragraphs that never carry an extractable field.
+# Removing them before the call trims ~8% of input tokens on the cached rulings;
+# each alternative is length-bounded so a missing end anchor can't eat the letter.
+_BOILERPLATE_RE = re.compile(
+    r"(?:Duty rates are provided for your convenience.{0,400}?usitc\.gov/?\s*\.?"
+    r"|The holding set forth above applies only.{0,1500}?periodic verification by CBP\."
+    r"|This ruling is being issued under the provisions of Part 177.{0,200}?177\)\.)",
+    re.DOTALL,
+)
+
+
+def _strip_boilerplate(text: str) -> str:
+    """Remove fixed legal boilerplate paragraphs from ruling text before sending it to the LLM."""
+    return _BOILERPLATE_RE.sub("", text)
+
+
+# Fields returned by the extraction prompt, in prompt order.
+_FIELDS = [
+    "ruling_id", "submitting_firm", "submitter", "importer", "date_submitted", "date_replied",
+    "replying_person", "case_handler", "hts_suggestion", "hts_decision", "duty_rate", "product_description",
+]
+
+# Structured-output schema mirroring the prompt's key list. Providers that support
+# it (see `json_schema` in PROVIDERS) are constrained to emit exactly this object,
+# so the response parses directly without the fence/prose fallbacks below.
+_SCHEMA = {
+    "type": "object",
+    "properties": {k: {"type": ["string", "null"]} for k in _FIELDS},
+    "required": list(_FIELDS),
+    "additionalProperties": False,
+}
+
+_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {"name": "cbp_ruling", "strict": True, "schema": _SCHEMA},
+}
+
+_BATCH_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "cbp_ruling_batch",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {"rulings": {"type": "array", "items": _SCHEMA}},
+            "required": ["rulings"],
+            "additionalProperties": False,
+        },
+    },
+}
+
+
+# Extracted answers keyed by a hash of the full request (provider, model, prompt,
+# ruling text). Identical requests within a run are served from memory; with a
+# cache_dir they are also persisted, so re-runs skip the API entirely.
+_MEMO: dict = {}
+_MEMO_MAX = 512
+_MEMO_LOCK = threading.Lock()
+
+
+def _request_key(provider: str, payload: dict) -> str:
+    """Hash everything that determines the answer (service tier only affects latency/price)."""
+    keyed = {k: v for k, v in payload.items() if k != "service_tier"}
+    raw = json.dumps([provider, keyed], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def _memo_put(key: str, data: dict) -> None:
+    with _MEMO_LOCK:
+        if key not in _MEMO and len(_MEMO) >= _MEMO_MAX:
+            _MEMO.pop(next(iter(_MEMO)))
+        _MEMO[key] = data
+
+
+def _memo_get(key: str, cache_path: Optional[str]) -> Optional[dict]:
+    """Return the remembered answer for `key` (memory first, then `cache_path`), or None."""
+    cached = _MEMO.get(key)
+    if cached is None and cache_path:
+        cached = load_json_if_exists(cache_path)
+        if not isinstance(cached, dict):
+            return None
+        _memo_put(key, cached)
+    return cached
+
+
+def _memo_store(key: str, cache_path: Optional[str], data: dict) -> None:
+    """Remember `data` for `key` in memory and, with a `cache_path`, on disk."""
+    _memo_put(key, dict(data))
+    if cache_path:
+        # Write-then-rename so concurrent workers never read a partial file
+        ensure_dir(os.path.dirname(cache_path))
+        tmp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        write_json(data, tmp_path)
+        os.replace(tmp_path, cache_path)
+
+
+# Field definitions and output rules shared by the single and batched prompts
+# (works across all OpenAI-compatible providers).
+_PROMPT_RULES = """Use null when unknown. Do not add extra keys. No commentary.
 
+DATA DICTIONARY DEFINITIONS (use these strictly):
+- ruling_id: The ruling control number like N340865.
+- submitting_firm: The firm/company submitting the request, often a law firm.
+- submitter: The person submitting the request, e.g., "Ms. Kristina Barry".
+- importer: The client/on-behalf-of entity, e.g., "Toby Company".
+- date_submitted: The date in "In your letter dated Month DD, YYYY ...."
+- date_replied: Reply date near top (before "Dear ..."), format "Month DD, YYYY".
+- replying_person: Signature lines after "Sincerely,". Use "<br>" between lines.
+- case_handler: National Import Specialist name only (no email).
+- hts_suggestion: Requester's proposed HTS code.
+- hts_decision: CBP final HTS code.
+- duty_rate: After "The rate of duty will be ...".
+- product_description: Paragraph starting "The sample," describing merchandise.
 
-def llm_extract(
-    text: str,
-    model: str = "gpt-5-nano-2025-08-07",
-    provider: str = "openai",
-    ruling_id: Optional[str] = None
-) -> dict:
-    """
-    Run LLM extraction on a CBP ruling document.
+OUTPUT RULES:
+- dates must be "Month DD, YYYY" (not ISO).
+- HTS codes must look like ####.##.#### when present.
+- Do not invent values; only extract from given text.
+"""
 
-    Args:
-        text: Full ruling text (pretty/normalized form).
-        model: Model name (default: "gpt-5-nano").
-        provider: Provider key ("openai", "deepinfra", etc.).
-        ruling_id: Optional ruling ID for logging/tracking.
+_PROMPT = """
+You will be given the full text of a CBP customs classification ruling letter. Return ONLY valid JSON with EXACTLY these keys:
+ruling_id, submitting_firm, submitter, importer, date_submitted, date_replied, replying_person, case_handler, hts_suggestion, hts_decision, duty_rate, product_description.
 
-    Returns:
-        Python dict with extracted fields.
+""" + _PROMPT_RULES
 
-    Raises:
-        RuntimeError: Missing API key, API errors, or JSON parsing failures.
-    """
+_BATCH_PROMPT = """
+You will be given several CBP customs classification ruling letters, each between "### RULING <id>" and "### END". Return ONLY valid JSON of the form {"rulings": [...]} with one object per ruling, each with EXACTLY these keys:
+ruling_id, submitting_firm, submitter, importer, date_submitted, date_replied, replying_person, case_handler, hts_suggestion, hts_decision, duty_rate, product_description.
 
+""" + _PROMPT_RULES
+
+
+# Shared HTTP session: keeps TCP/TLS connections to the provider alive across
+# rulings instead of paying a fresh handshake on every call. Transient rate-limit
+# and server errors are retried with backoff by the adapter.
+_SESSION = requests.Session()
+_SESSION.headers.update({
+    "Content-Type": "application/json",
+    "Accept": "application/json",
+})
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset({"POST"}),
+            raise_on_status=False,
+        ),
+    ),
+)
+
+
+def _provider_request(provider: str) -> Tuple[dict, str, dict]:
+    """Validate provider credentials and return (provider_config, url, headers)."""
     if provider not in PROVIDERS:
         raise ValueError(f"Unknown provider: {provider}. Available: {list(PROVIDERS.keys())}")
     provider_config = PROVIDERS[provider]
@@ -71,55 +219,131 @@ def llm_extract(
 
     # Build request
     url = f"{provider_config['base_url']}/chat/completions"
+    # Content-Type/Accept are set once on the shared session
     headers = {
         "Authorization": f"Bearer {api_key}",
-        "Content-Type": "application/json",
-        "Accept": "application/json",
         "OpenAI-Organization": os.getenv("OPENAI_ORGANIZATION_ID", ""),
         "OpenAI-Project": os.getenv("OPENAI_PROJECT_ID", ""),
     }
+    return provider_config, url, headers
 
 
-    # Universal schema prompt (works across all OpenAI-compatible providers)
-    schema = """
-You will be given the full text of a CBP customs classification ruling letter. Return ONLY valid JSON with EXACTLY these keys:
-ruling_id, submitting_firm, submitter, importer, date_submitted, date_replied, replying_person, case_handler, hts_suggestion, hts_decision, duty_rate, product_description.
+def _parse_content(content: Optional[str], raw: str):
+    """Defensively parse the model's message content into a JSON value."""
+    if content is None:
+        raise RuntimeError("LLM returned null content")
 
-Use null when unknown. Do not add extra keys. No commentary.
+    content = content.strip()
+    if not content:
+        raise RuntimeError(f"LLM returned empty content. Raw: {raw[:500]}")
 
-DATA DICTIONARY DEFINITIONS (use these strictly):
-- ruling_id: The ruling control number like N340865.
-- submitting_firm: The firm/company submitting the request, often a law firm.
-- submitter: The person submitting the request, e.g., "Ms. Kristina Barry".
-- importer: The client/on-behalf-of entity, e.g., "Toby Company".
-- date_submitted: The date in "In your letter dated Month DD, YYYY ...."
-- date_replied: Reply date near top (before "Dear ..."), format "Month DD, YYYY".
-- replying_person: Signature lines after "Sincerely,". Use "<br>" between lines.
-- case_handler: National Import Specialist name only (no email).
-- hts_suggestion: Requester's proposed HTS code.
-- hts_decision: CBP final HTS code.
-- duty_rate: After "The rate of duty will be ...".
-- product_description: Paragraph starting "The sample," describing merchandise.
+    # Schema-constrained output is a bare JSON object and goes straight to
+    # json_loads; the fence/prose handling only matters for providers without
+    # structured-output support.
 
-OUTPUT RULES:
-- dates must be "Month DD, YYYY" (not ISO).
-- HTS codes must look like ####.##.#### when present.
-- Do not invent values; only extract from given text.
-"""
+    # Handle markdown fences
+    if content.startswith("```"):
+        content = _FENCE_HEAD_RE.sub("", content)
+        content = _FENCE_TAIL_RE.sub("", content).strip()
+
+    # Extract JSON object if wrapped in prose
+    if not content.startswith("{"):
+        m = _JSON_OBJ_RE.search(content)
+        if not m:
+            raise RuntimeError(f"LLM content is not JSON. Head: {content[:200]}")
+        content = m.group(0).strip()
 
-    # Universal payload structure
+    # Parse JSON
+    try:
+        return json_loads(content)
+    except json.JSONDecodeError as e:
+        raise RuntimeError(f"Failed to parse LLM JSON: {e}. Head: {content[:200]}") from e
+
+
+def _single_payload(text: str, model: str, service_tier: Optional[str], provider_config: dict) -> dict:
+    """Chat Completions payload for one ruling (also the answer-cache key source)."""
     payload = {
         "model": model,
         # "temperature": 0.0, # Not supported by gpt-5-nano
-        "service_tier": "flex",
         "messages": [
             {"role": "system", "content": "You extract structured fields from customs ruling letters. Output JSON only."},
-            {"role": "user", "content": schema + "\nTEXT:\n" + text},
+            {"role": "user", "content": _PROMPT + "\nTEXT:\n" + _strip_boilerplate(text)},
         ],
     }
+    if service_tier:
+        payload["service_tier"] = service_tier
+    if provider_config.get("json_schema"):
+        payload["response_format"] = _RESPONSE_FORMAT
+    return payload
+
+
+def _answer_key(provider: str, payload: dict, cache_dir: Optional[str]) -> Tuple[str, Optional[str]]:
+    """(request hash, on-disk answer path or None) for a single-ruling payload."""
+    key = _request_key(provider, payload)
+    cache_path = os.path.join(cache_dir, payload["model"].replace("/", "_"), f"{key}.json") if cache_dir else None
+    return key, cache_path
+
+
+def _cached_result(cached: dict) -> dict:
+    """`llm_extract`-shaped result for a remembered answer (no tokens spent)."""
+    return {
+        "extracted_data": dict(cached),
+        "token_usage": {"input_tokens": 0, "output_tokens": 0},
+        "cached": True,
+    }
+
+
+def _split_tokens(total: int, weights: List[int]) -> List[int]:
+    """Split `total` tokens in proportion to `weights`; the parts sum to `total` exactly."""
+    out, acc, prev = [], 0, 0
+    whole = sum(weights) or 1
+    for w in weights:
+        acc += w
+        cut = round(total * acc / whole)
+        out.append(cut - prev)
+        prev = cut
+    return out
+
+
+def llm_extract(
+    text: str,
+    model: str = "gpt-5-nano-2025-08-07",
+    provider: str = "openai",
+    ruling_id: Optional[str] = None,
+    service_tier: Optional[str] = "flex",
+    cache_dir: Optional[str] = None,
+) -> dict:
+    """
+    Run LLM extraction on a CBP ruling document.
+
+    Args:
+        text: Full ruling text (pretty/normalized form).
+        model: Model name (default: "gpt-5-nano").
+        provider: Provider key ("openai", "deepinfra", etc.).
+        ruling_id: Optional ruling ID for logging/tracking.
+        service_tier: OpenAI service tier ("flex" is cheaper but slower; None
+            omits the field for providers that don't accept it).
+        cache_dir: Optional directory for persisting answers keyed by request
+            hash. Cached answers report zero token usage and "cached": True.
+
+    Returns:
+        Python dict with extracted fields.
+
+    Raises:
+        RuntimeError: Missing API key, API errors, or JSON parsing failures.
+    """
+
+    provider_config, url, headers = _provider_request(provider)
+    payload = _single_payload(text, model, service_tier, provider_config)
+
+    # Serve repeated requests (same text, model and prompt) without an API call
+    key, cache_path = _answer_key(provider, payload, cache_dir)
+    cached = _memo_get(key, cache_path)
+    if cached is not None:
+        return _cached_result(cached)
 
     # Execute request
-    resp = requests.post(url, headers=headers, json=payload, timeout=90)
+    resp = _SESSION.post(url, headers=headers, json=payload, timeout=90)
     resp.raise_for_status()
 
     resp_json = resp.json()
@@ -133,30 +357,10 @@ OUTPUT RULES:
     content = resp_json["choices"][0]["message"]["content"]
 
     # Defensive parsing
-    if content is None:
-        raise RuntimeError("LLM returned null content")
+    extracted_data = _parse_content(content, resp.text)
 
-    content = content.strip()
-    if not content:
-        raise RuntimeError(f"LLM returned empty content. Raw: {resp.text[:500]}")
-
-    # Handle markdown fences
-    if content.startswith("```"):
-        content = re.sub(r"^```(?:json)?\s*", "", content, flags=re.IGNORECASE)
-        content = re.sub(r"\s*```$", "", content).strip()
-
-    # Extract JSON object if wrapped in prose
-    if not content.startswith("{"):
-        m = re.search(r"\{.*\}", content, flags=re.DOTALL)
-        if not m:
-            raise RuntimeError(f"LLM content is not JSON. Head: {content[:200]}")
-        content = m.group(0).strip()
-
-    # Parse JSON
-    try:
-        extracted_data = json.loads(content)
-    except json.JSONDecodeError as e:
-        raise RuntimeError(f"Failed to parse LLM JSON: {e}. Head: {content[:200]}") from e
+    if isinstance(extracted_data, dict):
+        _memo_store(key, cache_path, extracted_data)
 
     # Return both extracted data and token metrics
     return {
@@ -166,3 +370,122 @@ OUTPUT RULES:
             "output_tokens": output_tokens
         }
     }
+
+
+def llm_extract_batch(
+    items: List[Tuple[str, str]],
+    model: str = "gpt-5-nano-2025-08-07",
+    provider: str = "openai",
+    service_tier: Optional[str] = "flex",
+    cache_dir: Optional[str] = None,
+) -> List[Union[dict, Exception]]:
+    """
+    Extract several rulings with one request ("row-marshaling").
+
+    The rulings are sent as delimited sections of a single prompt and the model
+    returns {"rulings": [...]}, one object per ruling. This amortizes the
+    per-request round-trip and the repeated instructions across the batch.
+
+    Args:
+        items: (ruling_id, text) pairs; keep batches small (4-8 rulings).
+        model: Model name.
+        provider: Provider key ("openai", "deepinfra", etc.).
+        service_tier: Passed through as in `llm_extract`.
+        cache_dir: Answer cache shared with `llm_extract`: rulings already
+            answered are not sent, and batch answers are stored under the
+            single-ruling request key.
+
+    Returns:
+        One entry per input item, in input order, shaped like `llm_extract`'s
+        result, or the exception raised for that ruling. Rulings missing from
+        the response, or a batch whose response cannot be parsed, fall back to
+        `llm_extract`. The batch's token usage is split over every ruling sent
+        (input by text length, output evenly); a fallback ruling's share is
+        added to its own usage, or set as `token_usage` on its exception, so
+        paid tokens are never dropped.
+    """
+    def _single(ruling_id: str, text: str) -> Union[dict, Exception]:
+        try:
+            return llm_extract(
+                text=text, model=model, provider=provider, ruling_id=ruling_id,
+                service_tier=service_tier, cache_dir=cache_dir,
+            )
+        except Exception as exc:
+            return exc
+
+    if len(items) <= 1:
+        return [_single(rid, text) for rid, text in items]
+
+    provider_config, url, headers = _provider_request(provider)
+
+    # Answers already remembered (memo or disk) are served without the request
+    results: List[Union[dict, Exception, None]] = [None] * len(items)
+    pending = []  # (index, ruling_id, text, answer key, answer cache path)
+    for i, (rid, text) in enumerate(items):
+        key, cache_path = _answer_key(provider, _single_payload(text, model, service_tier, provider_config), cache_dir)
+        cached = _memo_get(key, cache_path)
+        if cached is not None:
+            results[i] = _cached_result(cached)
+        else:
+            pending.append((i, rid, text, key, cache_path))
+
+    if len(pending) <= 1:
+        for i, rid, text, _, _ in pending:
+            results[i] = _single(rid, text)
+        return results
+
+    texts = [_strip_boilerplate(text) for _, _, text, _, _ in pending]
+    sections = "\n\n".join(
+        f"### RULING {rid}\n{text}\n### END" for (_, rid, _, _, _), text in zip(pending, texts)
+    )
+    payload = {
+        "model": model,
+        "messages": [
+            {"role": "system", "content": "You extract structured fields from customs ruling letters. Output JSON only."},
+            {"role": "user", "content": _BATCH_PROMPT + "\nRULINGS:\n" + sections},
+        ],
+    }
+    if service_tier:
+        payload["service_tier"] = service_tier
+    if provider_config.get("json_schema"):
+        payload["response_format"] = _BATCH_RESPONSE_FORMAT
+
+    by_id = {}
+    input_tokens = output_tokens = 0
+    try:
+        resp = _SESSION.post(url, headers=headers, json=payload, timeout=180)
+        resp.raise_for_status()
+        resp_json = resp.json()
+        # Tokens are billed once the request succeeds, whatever the content
+        usage = resp_json.get("usage", {})
+        input_tokens = usage.get("prompt_tokens", 0)
+        output_tokens = usage.get("completion_tokens", 0)
+        parsed = _parse_content(resp_json["choices"][0]["message"]["content"], resp.text)
+        rows = parsed.get("rulings", []) if isinstance(parsed, dict) else []
+        for row in rows:
+            if isinstance(row, dict) and isinstance(row.get("ruling_id"), str):
+                by_id[row["ruling_id"].strip().upper()] = row
+    except Exception:
+        # Whole batch unusable: every ruling goes through the single-call path
+        by_id = {}
+
+    in_shares = _split_tokens(input_tokens, [len(t) for t in texts])
+    out_shares = _split_tokens(output_tokens, [1] * len(pending))
+    for (i, rid, text, key, cache_path), in_share, out_share in zip(pending, in_shares, out_shares):
+        row = by_id.get(rid.strip().upper())
+        if row is not None:
+            _memo_store(key, cache_path, row)
+            results[i] = {
+                "extracted_data": row,
+                "token_usage": {"input_tokens": in_share, "output_tokens": out_share},
+            }
+            continue
+        result = _single(rid, text)
+        if isinstance(result, Exception):
+            result.token_usage = {"input_tokens": in_share, "output_tokens": out_share}
+        else:
+            usage = result["token_usage"]
+            usage["input_tokens"] += in_share
+            usage["output_tokens"] += out_share
+        results[i] = result
+    return results
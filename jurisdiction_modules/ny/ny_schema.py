@@ -48,15 +48,13 @@ def normalize_replying_person(val: str) -> str:
     if "<br" in v.lower():
         # normalize common variants to exact delimiter
         v = v.replace("<br />", "<br>").replace("<br/>", "<br>")
-        parts = [p for p in v.split("<br>")]
-        parts = [collapse_ws(p) for p in parts if collapse_ws(p)]
-        return "<br>".join(parts)
+        parts = map(collapse_ws, v.split("<br>"))
+        return "<br>".join(p for p in parts if p)
 
     # Otherwise treat as multiline plain text
     lines = [ln.strip() for ln in v.splitlines() if ln.strip()]
     if len(lines) >= 2:
-        lines = [collapse_ws(x) for x in lines if collapse_ws(x)]
-        return "<br>".join(lines)
+        return "<br>".join(collapse_ws(x) for x in lines)
 
     return collapse_ws(v)
 
@@ -86,10 +84,10 @@ def export_to_goal_schema(internal_obj: dict, bench_spec: dict) -> dict:
     # Special formatting rule for benchmark compatibility
     out["replying_person"] = normalize_replying_person(out.get("replying_person"))
 
-    # Generic whitespace collapse for other strings (skip replying_person, already handled)
-    for k, v in list(out.items()):
-        if v is None or not isinstance(v, str) or k == "replying_person":
-            continue
-        out[k] = collapse_ws(v)
+    # Generic whitespace collapse for other strings (skip replying_person, already handled).
+    # Values are replaced in place, so iterating the live dict is safe.
+    for k, v in out.items():
+        if isinstance(v, str) and k != "replying_person":
+            out[k] = collapse_ws(v)
 
     return out
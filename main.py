@@ -15,25 +15,23 @@ Usage:
   python main.py --llm                  # Full: regex + LLM comparison
   python main.py --excel                # Regex + Excel review (no LLM)
   python main.py --llm --excel          # Full + Excel review
+  python main.py --llm --llm_batch_size 6   # LLM with 6 rulings per request
   python main.py --jurisdiction ny      # Explicit NY (default)
   python main.py --jurisdiction ca      # CA rulings (once implemented)
   python main.py --base-dir /path       # Custom base directory (instead of cwd)
 """
 
 import argparse
-import json
 import os
-from dataclasses import asdict
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict
 from datetime import datetime as dt
 
 from shared_modules.io_inputs import load_ruling_ids, load_benchmark_spec, load_benchmark_values
 from shared_modules.reports import triage_report_goal
-from shared_modules.utils import ensure_dir, load_json_if_exists
-from shared_modules.excel_export import export_to_excel
-from shared_modules.fetchers_report import run_all_tiers, export_fetchers_report
+from shared_modules.utils import ensure_dir, load_records, save_records, write_json
 from shared_modules.performance_logger import PerformanceLogger
-from shared_modules.llm_config import LLM_PRICING
+from shared_modules.llm_config import PRICING_FLAT
 
 
 
@@ -50,6 +48,12 @@ def main() -> None:
         action="store_true",
         help="Also run LLM extraction via the default OpenAI 5 Nano Model API, or the speccified optional model"
     )
+    parser.add_argument(
+        "--llm_batch_size",
+        type=int,
+        default=1,
+        help="With --llm, send this many rulings per LLM request (default 1 = one request per ruling)"
+    )
     parser.add_argument(
         "--excel",
         action="store_true",
@@ -92,7 +96,7 @@ def main() -> None:
         from shared_modules.config import NY_FALLBACK_RULING_IDS
         from jurisdiction_modules.ny.ny_regex_parser import extract_record
         from jurisdiction_modules.ny.ny_schema import export_to_goal_schema
-        from jurisdiction_modules.ny.ny_llm import llm_extract
+        from jurisdiction_modules.ny.ny_llm import llm_extract, llm_extract_batch
     elif jurisdiction == "ca":
         raise NotImplementedError(
             "CA jurisdiction is not yet implemented. "
@@ -110,6 +114,7 @@ def main() -> None:
         base_dir = os.getcwd()
 
     cache_dir = os.path.join(base_dir, "cache_data", jurisdiction)
+    llm_cache_dir = os.path.join(cache_dir, "llm")           # LLM answers keyed by request hash
     out_dir = os.path.join(base_dir, "output_data", jurisdiction)
     raw_dir = os.path.join(out_dir, "extractions_raw")     # Raw extraction results
     checks_dir = os.path.join(out_dir, "checks")           # Comparison/triage reports
@@ -154,7 +159,7 @@ def main() -> None:
     llm_raw_records: List[Dict] = []
     llm_updated_this_run = False
     if not args.llm:
-        cached = load_json_if_exists(llm_raw_path)
+        cached = load_records(llm_raw_path)
         if isinstance(cached, list):
             # Convert cached LLM results to goal schema format for comparison
             llm_raw_records = [export_to_goal_schema(r, bench_spec) for r in cached]
@@ -166,6 +171,8 @@ def main() -> None:
     # ====================
 
     phase0_start = dt.now()
+    # Every source is de-duplicated (first occurrence wins), so each ruling is
+    # downloaded, parsed and sent to the LLM at most once per run.
     ruling_ids, id_source = load_ruling_ids(base_dir, fallback=NY_FALLBACK_RULING_IDS, jurisdiction=jurisdiction)
     phase0_elapsed = (dt.now() - phase0_start).total_seconds()
     n_rulings = len(ruling_ids)
@@ -210,7 +217,9 @@ def main() -> None:
 
     LLM_MODEL = "gpt-5-nano-2025-08-07"
     LLM_PROVIDER = "openai"
-    llm_price = LLM_PRICING.get(LLM_PROVIDER, {}).get(LLM_MODEL, {"input_per_1k": 0.0, "output_per_1k": 0.0})
+    FETCH_WORKERS = 16   # concurrent document fetch + regex parse jobs
+    LLM_WORKERS = 8      # concurrent LLM calls (keep within provider RPM limits)
+    llm_price = PRICING_FLAT.get((LLM_PROVIDER, LLM_MODEL), {"input_per_1k": 0.0, "output_per_1k": 0.0})
 
     # Running totals
     total_in_tok = 0
@@ -237,65 +246,129 @@ def main() -> None:
     print(hdr)
     print("-" * len(hdr))
 
-    # Print for each Ruling processed the tabular summary in the terminal
-    for row_num, rid in enumerate(ruling_ids, 1):
-        is_cache_hit = rid in cached_set
-
+    # Fetch+regex and LLM calls are independent network-bound work per ruling,
+    # so they run on thread pools. Results are consumed below in ruling order,
+    # so the table, totals and output records stay deterministic.
+    def fetch_and_parse(rid: str) -> Dict:
         # --- Document fetch ---
         fetch_start = dt.now()
         try:
             rec, text = extract_record(rid, cache_dir=cache_dir, jurisdiction=jurisdiction)
             fetch_end = dt.now()
             fetch_status = "Complete"
-        except Exception as fetch_exc:
+        except Exception:
             fetch_end = dt.now()
             fetch_status = "Failed"
             text = ""
             rec = None
-        fetch_elapsed = (fetch_end - fetch_start).total_seconds()
-        total_fetch_sec += fetch_elapsed
-
-        if not is_cache_hit:
-            phase1_elapsed_sec += fetch_elapsed
-            remaining_to_fetch -= 1
-            print(f"  [FETCH]  {rid:<9} {fetch_elapsed:.2f}s   ({remaining_to_fetch} remaining)")
-
-        fetch_display = "(cache)" if is_cache_hit else f"{fetch_elapsed:.2f}s"
-        row_label = f"{row_num}/{n_rulings}"
 
         # --- Regex parsing ---
         rx_start = dt.now()
+        goal = None
         try:
             if rec is not None:
-                regex_raw_records.append(export_to_goal_schema(asdict(rec), bench_spec))
+                goal = export_to_goal_schema(rec.to_dict(), bench_spec)
                 rx_end = dt.now()
                 rx_status = "Complete"
-                regex_ok += 1
             else:
                 raise ValueError("No record from fetch")
         except Exception:
             rx_end = dt.now()
             rx_status = "Failed"
-            regex_fail += 1
 
-        rx_elapsed = (rx_end - rx_start).total_seconds()
-        total_rx_sec += rx_elapsed
+        return {
+            "text": text, "goal": goal,
+            "fetch_start": fetch_start, "fetch_end": fetch_end, "fetch_status": fetch_status,
+            "rx_start": rx_start, "rx_end": rx_end, "rx_status": rx_status,
+        }
 
-        if perf_logger:
-            perf_logger.track_ruling(is_cached=False)
-            perf_logger.track_fetch(ruling_id=rid, start=fetch_start, end=fetch_end, status=fetch_status, cache_hit=False)
-            perf_logger.track_regex(ruling_id=rid, start=rx_start, end=rx_end, status=rx_status)
-
-        # --- LLM extraction (optional) ---
-        if args.llm:
-            llm_start = dt.now()
-            llm_end = llm_start
-            llm_status = "Failed"
-            in_tok = out_tok = 0
-            cost = 0.0
+    def llm_row(llm_result, llm_start, llm_end) -> Dict:
+        if isinstance(llm_result, Exception):
+            return {"result": None, "goal": None, "error": llm_result, "start": llm_start, "end": llm_end}
+        try:
+            goal = export_to_goal_schema(llm_result["extracted_data"], bench_spec)
+        except Exception as exc:
+            exc.token_usage = llm_result.get("token_usage")  # still paid for
+            return {"result": None, "goal": None, "error": exc, "start": llm_start, "end": llm_end}
+        return {"result": llm_result, "goal": goal, "error": None, "start": llm_start, "end": llm_end}
+
+    def run_llm(positions: List[int]) -> List[Dict]:
+        # Waits for these rulings' texts, then makes the (rate-limited) API call:
+        # one request per ruling, or one row-marshaled request for the group.
+        items = [(ruling_ids[i], fetch_futures[i].result()["text"]) for i in positions]
+        llm_start = dt.now()
+        if len(items) == 1:
+            rid, text = items[0]
             try:
-                llm_result = llm_extract(text=text, ruling_id=rid)
-                token_usage = llm_result.get("token_usage", {})
+                results = [llm_extract(text=text, ruling_id=rid, cache_dir=llm_cache_dir)]
+            except Exception as exc:
+                results = [exc]
+        else:
+            results = llm_extract_batch(items, cache_dir=llm_cache_dir)
+        # A batch is one wall-clock interval: give each ruling an equal,
+        # consecutive slice so per-ruling durations sum to the batch duration
+        # (rather than every ruling reporting the whole batch).
+        share = (dt.now() - llm_start) / len(results)
+        return [
+            llm_row(r, llm_start + share * k, llm_start + share * (k + 1))
+            for k, r in enumerate(results)
+        ]
+
+    batch_size = max(1, args.llm_batch_size)
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as fetch_ex, \
+            ThreadPoolExecutor(max_workers=LLM_WORKERS) as llm_ex:
+        fetch_futures = [fetch_ex.submit(fetch_and_parse, rid) for rid in ruling_ids]
+
+        # llm_slots[i] = (future for ruling i's group, ruling i's index within it)
+        llm_slots = []
+        if args.llm:
+            for start in range(0, n_rulings, batch_size):
+                positions = list(range(start, min(start + batch_size, n_rulings)))
+                group_future = llm_ex.submit(run_llm, positions)
+                llm_slots.extend((group_future, j) for j in range(len(positions)))
+
+        # Print for each Ruling processed the tabular summary in the terminal
+        for row_num, rid in enumerate(ruling_ids, 1):
+            is_cache_hit = rid in cached_set
+            res = fetch_futures[row_num - 1].result()
+
+            fetch_start, fetch_end, fetch_status = res["fetch_start"], res["fetch_end"], res["fetch_status"]
+            fetch_elapsed = (fetch_end - fetch_start).total_seconds()
+            total_fetch_sec += fetch_elapsed
+
+            if not is_cache_hit:
+                phase1_elapsed_sec += fetch_elapsed
+                remaining_to_fetch -= 1
+                print(f"  [FETCH]  {rid:<9} {fetch_elapsed:.2f}s   ({remaining_to_fetch} remaining)")
+
+            fetch_display = "(cache)" if is_cache_hit else f"{fetch_elapsed:.2f}s"
+            row_label = f"{row_num}/{n_rulings}"
+
+            rx_start, rx_end, rx_status = res["rx_start"], res["rx_end"], res["rx_status"]
+            if res["goal"] is not None:
+                regex_raw_records.append(res["goal"])
+                regex_ok += 1
+            else:
+                regex_fail += 1
+
+            rx_elapsed = (rx_end - rx_start).total_seconds()
+            total_rx_sec += rx_elapsed
+
+            if perf_logger:
+                perf_logger.track_ruling(is_cached=False)
+                perf_logger.track_fetch(ruling_id=rid, start=fetch_start, end=fetch_end, status=fetch_status, cache_hit=False)
+                perf_logger.track_regex(ruling_id=rid, start=rx_start, end=rx_end, status=rx_status)
+
+            # --- LLM extraction (optional) ---
+            if args.llm:
+                group_future, j = llm_slots[row_num - 1]
+                llm_res = group_future.result()[j]
+                llm_start, llm_end = llm_res["start"], llm_res["end"]
+                # A failed ruling may still carry paid tokens (its share of a batch request)
+                if llm_res["error"] is None:
+                    token_usage = llm_res["result"].get("token_usage", {})
+                else:
+                    token_usage = getattr(llm_res["error"], "token_usage", None) or {}
                 in_tok = token_usage.get("input_tokens", 0)
                 out_tok = token_usage.get("output_tokens", 0)
                 cost = (in_tok / 1000 * llm_price["input_per_1k"]) + (out_tok / 1000 * llm_price["output_per_1k"])
@@ -303,39 +376,38 @@ def main() -> None:
                 total_out_tok += out_tok
                 total_cost += cost
 
-                llm_raw_records.append(export_to_goal_schema(llm_result["extracted_data"], bench_spec))
-                llm_updated_this_run = True
-                llm_end = dt.now()
-                llm_status = "Complete"
-                llm_ok += 1
-            except Exception as exc:
-                    llm_end = dt.now()
+                if llm_res["error"] is None:
+                    llm_raw_records.append(llm_res["goal"])
+                    llm_updated_this_run = True
+                    llm_status = "Complete"
+                    llm_ok += 1
+                else:
                     llm_status = "Failed"
                     llm_fail += 1
-                    print(f"  [LLM ERROR] {rid}: {exc}")
-            llm_elapsed = (llm_end - llm_start).total_seconds()
-            total_llm_sec += llm_elapsed
-
-            if perf_logger:
-                perf_logger.track_llm_call(
-                    provider=LLM_PROVIDER,
-                    model=LLM_MODEL,
-                    input_tokens=in_tok,
-                    output_tokens=out_tok,
-                    ruling_id=rid,
-                    start=llm_start,
-                    end=llm_end,
-                    status=llm_status,
+                    print(f"  [LLM ERROR] {rid}: {llm_res['error']}")
+                llm_elapsed = (llm_end - llm_start).total_seconds()
+                total_llm_sec += llm_elapsed
+
+                if perf_logger:
+                    perf_logger.track_llm_call(
+                        provider=LLM_PROVIDER,
+                        model=LLM_MODEL,
+                        input_tokens=in_tok,
+                        output_tokens=out_tok,
+                        ruling_id=rid,
+                        start=llm_start,
+                        end=llm_end,
+                        status=llm_status,
+                    )
+
+                print(
+                    f"{row_label:<8} {fetch_display:<10} {rid:<9} {rx_start.strftime('%H:%M:%S'):<9} {rx_end.strftime('%H:%M:%S'):<9} {rx_status:<12} {rx_elapsed:>7.2f}"
+                    f" {llm_start.strftime('%H:%M:%S'):<10} {llm_end.strftime('%H:%M:%S'):<9} {llm_status:<12} {llm_elapsed:>8.2f}"
+                    f" {in_tok:>7} {out_tok:>7} ${cost:>9.4f}"
                 )
 
-            print(
-                f"{row_label:<8} {fetch_display:<10} {rid:<9} {rx_start.strftime('%H:%M:%S'):<9} {rx_end.strftime('%H:%M:%S'):<9} {rx_status:<12} {rx_elapsed:>7.2f}"
-                f" {llm_start.strftime('%H:%M:%S'):<10} {llm_end.strftime('%H:%M:%S'):<9} {llm_status:<12} {llm_elapsed:>8.2f}"
-                f" {in_tok:>7} {out_tok:>7} ${cost:>9.4f}"
-            )
-
-        else:
-            print(f"{row_label:<8} {fetch_display:<10} {rid:<9} {rx_start.strftime('%H:%M:%S'):<9} {rx_end.strftime('%H:%M:%S'):<9} {rx_status:<12} {rx_elapsed:>7.2f}")
+            else:
+                print(f"{row_label:<8} {fetch_display:<10} {rid:<9} {rx_start.strftime('%H:%M:%S'):<9} {rx_end.strftime('%H:%M:%S'):<9} {rx_status:<12} {rx_elapsed:>7.2f}")
 
 
     # Print the Totals row
@@ -365,10 +437,13 @@ def main() -> None:
 
 
     if args.fetchers_report:
+        # Imported on demand: only this optional report needs it
+        from shared_modules.fetchers_report import run_all_tiers, export_fetchers_report
+
         print("\n" + "=" * 60)
         print("RUNNING FETCHERS REPORT")
         print("=" * 60)
-        fetchers_results = run_all_tiers(ruling_ids, cache_dir, jurisdiction=jurisdiction)
+        fetchers_results = run_all_tiers(ruling_ids, cache_dir, jurisdiction=jurisdiction, max_workers=FETCH_WORKERS)
         timestamp = dt.now().strftime("%Y%m%d_%H%M%S")
         fetchers_excel_path = os.path.join(checks_dir, f"fetchers_report_{timestamp}.xlsx")
         export_fetchers_report(fetchers_results, fetchers_excel_path)
@@ -377,14 +452,13 @@ def main() -> None:
     # SAVE RAW EXTRACTIONS
     # ====================
 
-    # Store regex results (always generated)
-    with open(regex_raw_path, "w", encoding="utf-8") as f:
-        json.dump(regex_raw_records, f, ensure_ascii=False, indent=2)
+    # Store regex results (always generated). JSON plus a Parquet sibling
+    # when pyarrow is available, which reloads much faster on large runs.
+    save_records(regex_raw_records, regex_raw_path)
 
     # Store LLM results (only if --llm was used and extraction succeeded)
     if args.llm and llm_raw_records:
-        with open(llm_raw_path, "w", encoding="utf-8") as f:
-            json.dump(llm_raw_records, f, ensure_ascii=False, indent=2)
+        save_records(llm_raw_records, llm_raw_path)
 
     # ====================
     # GENERATE TRIAGE REPORT
@@ -401,8 +475,7 @@ def main() -> None:
         include_fields_where_method_vs_bench=True,
     )
 
-    with open(triage_path, "w", encoding="utf-8") as f:
-        json.dump(triage, f, ensure_ascii=False, indent=2)
+    write_json(triage, triage_path)
 
     # ====================
     # OPTIONAL EXCEL EXPORT
@@ -411,6 +484,9 @@ def main() -> None:
     if args.excel and excel_path:
 
         from datetime import datetime
+        # Imported on demand: pandas/openpyxl are slow to load and only the
+        # Excel export needs them
+        from shared_modules.excel_export import export_to_excel
 
         export_to_excel(
             output_path=excel_path,
@@ -1,36 +1,45 @@
 import argparse
 import os
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
 
 
-def _try_delete(path: Path) -> bool:
+# Concurrent unlinks: deletion is latency-bound per call on Windows/network
+# drives, so overlapping calls helps where a single thread would just wait.
+UNLINK_WORKERS = 32
+
+
+def _unlink(path: str) -> Optional[str]:
+    """Delete one file; return its path if it could not be deleted."""
     try:
-        if path.is_dir():
-            # remove empty dirs only; files are handled elsewhere
-            path.rmdir()
-        else:
-            path.unlink()
-        return True
-    except Exception:
-        return False
+        os.unlink(path)
+    except OSError:
+        return path
+    return None
 
 
 def clean_cache(cache_dir: str) -> int:
-    cache_path = Path(cache_dir)
-    if not cache_path.exists():
-        print(f"[clean_cache] Nothing to do (missing): {cache_path}")
+    if not os.path.exists(cache_dir):
+        print(f"[clean_cache] Nothing to do (missing): {cache_dir}")
         return 0
 
-    failed = []
-    # Delete files first
-    for p in sorted(cache_path.rglob("*")):
-        if p.is_file():
-            if not _try_delete(p):
-                failed.append(p)
+    # One bottom-up walk lists every file and every directory; directories
+    # come out deepest first, the order they have to be removed in.
+    files, dirs = [], []
+    for root, dirnames, filenames in os.walk(cache_dir, topdown=False):
+        files.extend(os.path.join(root, name) for name in filenames)
+        dirs.extend(os.path.join(root, name) for name in dirnames)
+
+    with ThreadPoolExecutor(max_workers=UNLINK_WORKERS) as ex:
+        failed = [p for p in ex.map(_unlink, files) if p is not None]
 
-    # Then delete empty dirs (deepest first)
-    for p in sorted([x for x in cache_path.rglob("*") if x.is_dir()], reverse=True):
-        _try_delete(p)
+    # Then delete empty dirs (deepest first); cache_dir itself stays
+    for d in dirs:
+        try:
+            # remove empty dirs only; non-empty ones hold undeletable files
+            os.rmdir(d)
+        except OSError:
+            pass
 
     if failed:
         print("[clean_cache] Could not delete (likely locked by Word/WINWORD.exe):")
@@ -39,7 +48,7 @@ def clean_cache(cache_dir: str) -> int:
         print("\nClose Word (and ensure no WINWORD.exe is lingering), then re-run clean_cache.py.")
         return 1
 
-    print(f"[clean_cache] Cache cleared: {cache_path}")
+    print(f"[clean_cache] Cache cleared: {cache_dir}")
     return 0
 
 
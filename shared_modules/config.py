@@ -14,6 +14,8 @@ multiple modules and CLIs.
 """
 
 import os
+from typing import List, Tuple
+
 from dotenv import load_dotenv
 
 
@@ -35,5 +37,14 @@ YEAR_CANDIDATES = [2026, 2025, 2024, 2023, 2022, 2021, 2020, 2019, 2018, 2017, 2
 DOC_URL_TEMPLATE = "https://rulings.cbp.gov/api/getdoc/{jurisdiction}/{year}/{ruling_id}.doc"
 
 
+def build_candidate_urls(ruling_id: str, jurisdiction: str = "ny") -> List[Tuple[int, str]]:
+    """Return (year, document URL) for every YEAR_CANDIDATES entry, in order.
+    Built once per ruling so the download loop just iterates the list."""
+    return [
+        (year, DOC_URL_TEMPLATE.format(jurisdiction=jurisdiction, year=year, ruling_id=ruling_id))
+        for year in YEAR_CANDIDATES
+    ]
+
+
 # Load environment variables
 load_dotenv()
@@ -30,11 +30,45 @@ Usage (from main.py):
 """
 
 import json
+import re
+import warnings
+from copy import copy
+import numpy as np
 import pandas as pd
+from pandas.api.types import is_scalar
+from decimal import Decimal
 from pathlib import Path
 from typing import List, Dict, Optional
-from datetime import datetime
-from openpyxl.styles import Alignment
+from datetime import date, datetime, timedelta
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.formatting.rule import CellIsRule, ColorScaleRule
+from openpyxl.styles import Alignment, Font, PatternFill
+from openpyxl.utils import get_column_letter
+from openpyxl.worksheet.table import Table, TableStyleInfo
+from shared_modules.utils import json_loads
+
+
+# <br>, <br/>, <br />, <BR> ... and any run of CR/LF characters
+_BR_RE = re.compile(r"<br\s*/?>", re.IGNORECASE)
+_NEWLINES_RE = re.compile(r"[\r\n]+")
+
+# Shared styles: built once and reused by every sheet, rule and cell
+_FILL_HEADER = PatternFill(start_color="000000", end_color="000000", fill_type="solid")
+_FILL_GREEN = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")   # Excel-ish light green
+_FILL_RED = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")     # Excel-ish light red
+_FILL_YELLOW = PatternFill(start_color="FFEB9C", end_color="FFEB9C", fill_type="solid")  # Excel-ish light yellow
+_FILL_NOTE = PatternFill(start_color="FFFF00", end_color="FFFF00", fill_type="solid")    # highlighter yellow
+_FONT_HEADER = Font(color="FFFFFF", bold=True)
+_FONT_BLACK = Font(color="000000")
+_ALIGN_TOP_LEFT = Alignment(horizontal="left", vertical="top", wrap_text=False)
+
+# 3-color scale for the summary n_disagree_* columns: green low, yellow mid, red high
+_DISAGREE_SCALE = dict(
+    start_type="min", start_color="C6EFCE",
+    mid_type="percentile", mid_value=50, mid_color="FFEB9C",
+    end_type="max", end_color="FFC7CE",
+)
 
 
 def _normalize_bench_values(bench_values: Optional[Dict | List]) -> Dict:
@@ -86,11 +120,10 @@ def _convert_br_to_newlines(text: Optional[str]) -> str:
         return text
 
     # Normalize all <br> variants to '\n'
-    t = text.replace("<br />", "\n").replace("<br/>", "\n").replace("<br>", "\n")
+    t = _BR_RE.sub("\n", text)
 
-    # Normalize existing CRLF/LF to LF, collapse any runs, then enforce blank lines
-    # Split on any line breaks, strip each line, drop empties
-    lines = [ln.strip() for ln in t.replace("\r\n", "\n").split("\n") if ln.strip()]
+    # Split on any run of line breaks (CRLF/LF/CR), strip each line, drop empties
+    lines = [ln.strip() for ln in _NEWLINES_RE.split(t) if ln.strip()]
 
     # Use CRLF because Excel sometimes only renders properly after edit with LF-only
     # And use DOUBLE CRLF to enforce a blank line between entries
@@ -98,28 +131,14 @@ def _convert_br_to_newlines(text: Optional[str]) -> str:
 
 
 
-def _style_header_row(ws, max_col: int) -> None:
-    from openpyxl.styles import Font, PatternFill, Alignment
-    from openpyxl.utils import get_column_letter
-
-    header_font = Font(color="FFFFFF", bold=True)
-    header_fill = PatternFill(start_color="000000", end_color="000000", fill_type="solid")
-    header_align = Alignment(horizontal="left", vertical="top", wrap_text=False)
-
-    for col_idx in range(1, max_col + 1):
-        cell = ws.cell(row=1, column=col_idx)
-        cell.font = header_font
-        cell.fill = header_fill
-        cell.alignment = header_align
-
-
-def _build_summary_df(triage: Dict, bench_values_dict: Dict) -> pd.DataFrame:
+def _build_summary_df(triage: Dict, bench_values_dict: Dict, ruling_ids: List[str]) -> pd.DataFrame:
     """
     Build summary sheet: one row per ruling_id with disagreement counts.
     
     Args:
         triage: Triage report dict from triage_report_goal()
         bench_values_dict: Normalized benchmark dict {ruling_id: record}
+        ruling_ids: Triage ruling IDs in row order (sorted once by the caller)
         
     Returns:
         DataFrame with columns: ruling_id, has_bench, has_llm, 
@@ -130,7 +149,8 @@ def _build_summary_df(triage: Dict, bench_values_dict: Dict) -> pd.DataFrame:
     # Pre-compute set of ruling IDs with benchmark
     bench_ruling_ids = set(bench_values_dict.keys())
     
-    for ruling_id, field_dict in triage.items():
+    for ruling_id in ruling_ids:
+        field_dict = triage[ruling_id]
         row = {"ruling_id": ruling_id}
         
         # Check if benchmark exists for this ruling
@@ -138,10 +158,7 @@ def _build_summary_df(triage: Dict, bench_values_dict: Dict) -> pd.DataFrame:
         row["has_bench"] = "Yes" if has_bench else "No"
         
         # Track which extraction types are present
-        has_llm = any(
-            field_dict.get(f, {}).get("llm") is not None
-            for f in field_dict
-        )
+        has_llm = any(values.get("llm") is not None for values in field_dict.values())
         row["has_llm"] = "Yes" if has_llm else "No"
         
         # Count disagreements between extraction types
@@ -183,14 +200,11 @@ def _build_summary_df(triage: Dict, bench_values_dict: Dict) -> pd.DataFrame:
         
         rows.append(row)
     
-    df_summary = pd.DataFrame(rows)
-    df_summary = df_summary.sort_values("ruling_id").reset_index(drop=True)
-    
-    return df_summary
+    return pd.DataFrame(rows)
 
 
 def _build_details_df(
-    triage: Dict,
+    ruling_ids: List[str],
     bench_spec: Dict,
     regex_records: List[Dict],
     llm_records: List[Dict],
@@ -202,7 +216,7 @@ def _build_details_df(
     Column order: ruling_id | extraction_type | url | field_1 | ... | field_N
     
     Args:
-        triage: Triage dict
+        ruling_ids: Triage ruling IDs in row order (sorted once by the caller)
         bench_spec: Benchmark specification with field_order
         regex_records: List of regex extraction results
         llm_records: List of LLM extraction results
@@ -221,59 +235,38 @@ def _build_details_df(
     regex_by_id = {r.get("ruling_id"): r for r in regex_records}
     llm_by_id = {r.get("ruling_id"): r for r in llm_records}
     
-    rows = []
-    
+    # Columnar build: one list per column, so the DataFrame allocates each
+    # column once instead of inferring columns from a list of row dicts.
+    # field_cols is keyed by unique field name (dict keys), as the row dicts were.
+    rids, etypes, urls = [], [], []
+    field_cols = {field: [] for field in field_order}
+
     # Iterate each ruling in triage
-    for ruling_id in sorted(triage.keys()):
+    for ruling_id in ruling_ids:
         url = _get_ruling_url(ruling_id)
-        
-        # Row 1: Regex extraction
-        regex_record = regex_by_id.get(ruling_id, {})
-        regex_row = {
-            "ruling_id": ruling_id,
-            "extraction_type": "regex",
-            "url": url
-        }
-        for field in field_order:
-            val = regex_record.get(field)
-            # Convert <br> to actual newlines for better Excel display
-            if field == "replying_person" and val:
-                val = _convert_br_to_newlines(val)
-            regex_row[field] = val if val is not None else "[No Data Extracted]"
-        rows.append(regex_row)
-        
+
+        # Row 1: Regex extraction (always present)
         # Row 2: LLM extraction (if available)
-        llm_record = llm_by_id.get(ruling_id)
-        if llm_record is not None:
-            llm_row = {
-                "ruling_id": ruling_id,
-                "extraction_type": "llm",
-                "url": url
-            }
-            for field in field_order:
-                val = llm_record.get(field)
-                if field == "replying_person" and val:
-                    val = _convert_br_to_newlines(val)
-                llm_row[field] = val if val is not None else "[No Data Extracted]"
-            rows.append(llm_row)
-        
         # Row 3: Benchmark ground truth (if available)
-        bench_record = bench_values_dict.get(ruling_id)
-        if bench_record is not None:
-            bench_row = {
-                "ruling_id": ruling_id,
-                "extraction_type": "bench",
-                "url": url
-            }
-            for field in field_order:
-                val = bench_record.get(field)
+        sources = (
+            ("regex", regex_by_id.get(ruling_id, {}), "[No Data Extracted]"),
+            ("llm", llm_by_id.get(ruling_id), "[No Data Extracted]"),
+            ("bench", bench_values_dict.get(ruling_id), "[Benchmark Missing]"),
+        )
+        for extraction_type, record, missing in sources:
+            if record is None:
+                continue
+            rids.append(ruling_id)
+            etypes.append(extraction_type)
+            urls.append(url)
+            for field, col in field_cols.items():
+                val = record.get(field)
+                # Convert <br> to actual newlines for better Excel display
                 if field == "replying_person" and val:
                     val = _convert_br_to_newlines(val)
-                bench_row[field] = val if val is not None else "[Benchmark Missing]"
-            rows.append(bench_row)
-    
-    df_details = pd.DataFrame(rows)
+                col.append(val if val is not None else missing)
 
+    df_details = pd.DataFrame({"ruling_id": rids, "extraction_type": etypes, "url": urls, **field_cols})
 
     df_details = df_details.copy()
     
@@ -374,7 +367,8 @@ def _build_metadata_df(
             "Rulings without LLM Results",
         ],
         "Value": [
-            timestamp.strftime("%Y-%m-%d %H:%M:%S"),
+            # Native Excel date (shown to the second) rather than a formatted string
+            timestamp.replace(microsecond=0),
             "Yes" if llm_enabled else "No",
             "Yes" if llm_available else "No",
             "Yes" if llm_updated_this_run else "No",
@@ -387,6 +381,11 @@ def _build_metadata_df(
     return pd.DataFrame(metadata)
 
 def _dedupe_columns(cols):
+    cols = list(cols)
+    # Common case: nothing to rename
+    if len(set(cols)) == len(cols):
+        return cols
+
     seen = {}
     out = []
     for c in cols:
@@ -399,92 +398,182 @@ def _dedupe_columns(cols):
     return out
 
 
-def _apply_table_formatting(writer, sheet_name: str, df: pd.DataFrame) -> None:
+def _write_sheet(
+    wb,
+    sheet_name: str,
+    df: pd.DataFrame,
+    cell_styles: Optional[Dict] = None,
+    widths: Optional[Dict[str, float]] = None,
+):
     """
-    Apply Excel table formatting to a sheet.
-    
-    Converts data range to a named Excel table with:
-    - Filter buttons on header row
-    - Predefined color scheme
-    - Auto-sized columns
-    
+    Stream `df` into a new write-only sheet formatted as a named Excel table.
+
+    The sheet gets:
+    - Black/white header row and filter buttons (Table_{sheet_name})
+    - Predefined table color scheme
+    - Auto-sized columns, every cell top-left aligned without wrap
+    - No gridlines
+
+    Write-only sheets cannot be revisited, so everything per-cell is decided
+    before the row is appended: `cell_styles` maps (df row position, column
+    position) to extra style attributes ({"fill": ..., "font": ...}); cells
+    with the same styling should share one dict, since each distinct dict is
+    registered with the workbook once.
+    `widths` overrides the auto-size for the given column letters.
+
     Args:
-        writer: pd.ExcelWriter object
-        sheet_name: Name of the sheet
-        df: DataFrame that was written to the sheet
+        wb: Write-only openpyxl Workbook
+        sheet_name: Name of the sheet (and suffix of the table name)
+        df: DataFrame to write (header row + one row per record)
+        cell_styles: Optional per-cell style overrides for data cells
+        widths: Optional {column letter: width} overrides
+
+    Returns:
+        The write-only worksheet (for conditional formatting rules)
     """
-    from openpyxl.worksheet.table import Table, TableStyleInfo
-    from openpyxl.utils.dataframe import dataframe_to_rows
-    
-    worksheet = writer.sheets[sheet_name]
-    
-    # Define table range: all data including header
-    max_row = len(df) + 1  # +1 for header
+    cell_styles = cell_styles or {}
+
+    ws = wb.create_sheet(sheet_name)
+    ws.sheet_view.showGridLines = False
+
+    # Column widths must be set before the first row is appended. String
+    # lengths for the whole frame come from one astype(str) and one object-array
+    # pass; `initial=0` keeps empty frames at header width instead of NaN.
     max_col = len(df.columns)
-    _style_header_row(worksheet, max_col)
+    str_len = np.frompyfunc(len, 1, 1)
+    col_max = str_len(df.astype(str).to_numpy(dtype=object)).max(axis=0, initial=0)
+    for idx, col in enumerate(df.columns, 1):
+        max_length = max(int(col_max[idx - 1]), len(col)) + 2
+
+        # Cap at 50 for readability (some fields are very long)
+        max_length = min(max_length, 50)
+        ws.column_dimensions[get_column_letter(idx)].width = max_length
+    for col_letter, width in (widths or {}).items():
+        ws.column_dimensions[col_letter].width = width
+
+    header = []
+    for col in df.columns:
+        cell = WriteOnlyCell(ws, value=_excel_value(col))
+        cell.font = _FONT_HEADER
+        cell.fill = _FILL_HEADER
+        cell.alignment = _ALIGN_TOP_LEFT
+        header.append(cell)
+    ws.append(header)
+
+    # Register each distinct style combination once and hand every data cell
+    # a copy of the resulting style ids, instead of hashing the same
+    # Alignment/fill/font objects per cell. Combinations are keyed by the
+    # identity of the override dict; callers share one dict per combination.
+    registered = {}
+
+    def _style_ids(overrides):
+        key = id(overrides)
+        if key not in registered:
+            template = WriteOnlyCell(ws)
+            template.alignment = _ALIGN_TOP_LEFT
+            for attr, style in overrides.items():
+                setattr(template, attr, style)
+            registered[key] = template._style
+        return registered[key]
+
+    no_overrides = {}
+    for i, values in enumerate(df.itertuples(index=False, name=None)):
+        row = []
+        for j, val in enumerate(values):
+            cell = WriteOnlyCell(ws)
+            cell._style = copy(_style_ids(cell_styles.get((i, j), no_overrides)))
+            # Bind the value after the style so dates keep their number format
+            cell.value = _excel_value(val)
+            row.append(cell)
+        ws.append(row)
+
+    # Build range string (e.g., "A1:Z100"); row 1 is the header
+    table_range = f"A1:{get_column_letter(max_col)}{len(df) + 1}"
 
-    # Build range string (e.g., "A1:Z100")
-    from openpyxl.utils import get_column_letter
-    start_col = get_column_letter(1)
-    end_col = get_column_letter(max_col)
-    table_range = f"{start_col}1:{end_col}{max_row}"
-    
-    # Create table
     tab = Table(displayName=f"Table_{sheet_name}", ref=table_range)
     style = TableStyleInfo(
         name="TableStyleLight8",
         showFirstColumn=False,
         showLastColumn=False,
-        showRowStripes=True, 
-        showColumnStripes=True    
+        showRowStripes=True,
+        showColumnStripes=True
     )
     tab.tableStyleInfo = style
     tab.totalsRowShown = True
 
-    worksheet.add_table(tab)
-    
-    # Auto-size columns
-    for idx, col in enumerate(df.columns, 1):
-        max_length = max(
-            df[col].astype(str).map(len).max(),
-            len(col)
-        ) + 2
-        
-        # Cap at 50 for readability (some fields are very long)
-        max_length = min(max_length, 50)
-        
-        col_letter = get_column_letter(idx)
-        worksheet.column_dimensions[col_letter].width = max_length
-        
-        # Adjust the text alignment
-        top_left_no_wrap = Alignment(horizontal="left", vertical="top", wrap_text=False)
+    # Write-only sheets cannot be read back, so name the table columns from
+    # the DataFrame header rather than letting openpyxl look them up.
+    tab._initialise_columns()
+    for table_col, col in zip(tab.tableColumns, df.columns):
+        table_col.name = str(col)
+
+    # add_table warns unconditionally in write-only mode; the columns are named above
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", message="In write-only mode you must add table columns manually")
+        ws.add_table(tab)
+    return ws
 
-        for row in worksheet.iter_rows(min_row=1, max_row=max_row, min_col=1, max_col=max_col):
-            for cell in row:
-                cell.alignment = top_left_no_wrap
+
+def _excel_value(val):
+    """
+    Convert a DataFrame value the way pandas' to_excel does.
+
+    Missing values become "", infinities "inf"/"-inf", numpy scalars their
+    Python equivalents, and anything that is not a number, bool or date is
+    written as str(val).
+    """
+    if isinstance(val, str) or val is None:
+        return "" if val is None else val
+    if isinstance(val, np.generic):
+        val = val.item()
+    if isinstance(val, float):
+        if val != val:
+            return ""
+        if val in (float("inf"), float("-inf")):
+            return "inf" if val > 0 else "-inf"
+        return val
+    if isinstance(val, (bool, int, Decimal, datetime, date)):
+        return val
+    if isinstance(val, timedelta):
+        return val.total_seconds() / 86400
+    if is_scalar(val) and pd.isna(val):
+        return ""
+    return str(val)
+
+
+def _add_yes_no_rules(ws, cell_range: str) -> None:
+    """Yes=green, No=red CF rules on `cell_range`."""
+    # Rules are built per range: openpyxl stamps each Rule with its priority
+    # (and dxf id on save), so one Rule object cannot be shared between ranges.
+    ws.conditional_formatting.add(
+        cell_range,
+        CellIsRule(operator="equal", formula=['"Yes"'], fill=_FILL_GREEN)
+    )
+    ws.conditional_formatting.add(
+        cell_range,
+        CellIsRule(operator="equal", formula=['"No"'], fill=_FILL_RED)
+    )
 
 
-def _apply_conditional_formatting(writer) -> None:
+def _apply_conditional_formatting(sheets: Dict, frames: Dict[str, pd.DataFrame]) -> None:
     """
     Apply Excel-native conditional formatting rules (dynamic, updates after edits).
 
     - summary: has_bench/has_llm Yes=green, No=red (as CF rules, not static fills)
     - summary: n_disagree_* columns get 3-color scale
     - metadata: Yes/No values in Value column get Yes=green, No=red (CF rules)
-    """
-    from openpyxl.styles import PatternFill
-    from openpyxl.formatting.rule import CellIsRule, ColorScaleRule
-    from openpyxl.utils import get_column_letter
-
-    yes_fill = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")  # Excel-ish light green
-    no_fill  = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")  # Excel-ish light red
 
+    Args:
+        sheets: {sheet name: worksheet}
+        frames: {sheet name: DataFrame written to it}, for headers and row counts
+    """
     # -------------------------
     # Summary sheet formatting
     # -------------------------
-    if "summary" in writer.sheets:
-        ws = writer.sheets["summary"]
-        header = list(ws.iter_rows(min_row=1, max_row=1, values_only=True))[0]
+    if "summary" in sheets:
+        ws = sheets["summary"]
+        header = list(frames["summary"].columns)
+        max_row = len(frames["summary"]) + 1
 
         def _col_index(col_name: str) -> int | None:
             try:
@@ -498,229 +587,159 @@ def _apply_conditional_formatting(writer) -> None:
             if not col_idx:
                 continue
             col_letter = get_column_letter(col_idx)
-            cell_range = f"{col_letter}2:{col_letter}{ws.max_row}"
+            cell_range = f"{col_letter}2:{col_letter}{max_row}"
 
-            ws.conditional_formatting.add(
-                cell_range,
-                CellIsRule(operator="equal", formula=['"Yes"'], fill=yes_fill)
-            )
-            ws.conditional_formatting.add(
-                cell_range,
-                CellIsRule(operator="equal", formula=['"No"'], fill=no_fill)
-            )
+            _add_yes_no_rules(ws, cell_range)
 
         # Color scales for all numeric disagreement columns
         # IMPORTANT: do NOT use the old buggy col_name[11].isdigit() logic
-        for col_idx, col_name in enumerate(header, 1):
-            if not col_name:
-                continue
-            if str(col_name).startswith("n_disagree_"):
-                col_letter = get_column_letter(col_idx)
-                cell_range = f"{col_letter}2:{col_letter}{ws.max_row}"
-
-                # Only apply if cells are numeric; your "No Bench" strings will simply not participate
-                ws.conditional_formatting.add(
-                    cell_range,
-                    ColorScaleRule(
-                        start_type="min", start_color="C6EFCE",   # green low
-                        mid_type="percentile", mid_value=50, mid_color="FFEB9C",  # yellow mid
-                        end_type="max", end_color="FFC7CE"       # red high
-                    )
-                )
+        disagree_cols = [
+            col_idx for col_idx, col_name in enumerate(header, 1)
+            if col_name and str(col_name).startswith("n_disagree_")
+        ]
+        for col_idx in disagree_cols:
+            col_letter = get_column_letter(col_idx)
+            cell_range = f"{col_letter}2:{col_letter}{max_row}"
+
+            # Only apply if cells are numeric; your "No Bench" strings will simply not participate
+            ws.conditional_formatting.add(cell_range, ColorScaleRule(**_DISAGREE_SCALE))
 
     # -------------------------
     # Metadata sheet formatting
     # -------------------------
-    if "metadata" in writer.sheets:
-        ws = writer.sheets["metadata"]
+    if "metadata" in sheets:
+        ws = sheets["metadata"]
 
         # We expect 2 columns: Key | Value
         # Apply Yes/No rules to entire Value column (col B), rows 2..max
-        cell_range = f"B2:B{ws.max_row}"
+        cell_range = f"B2:B{len(frames['metadata']) + 1}"
 
-        ws.conditional_formatting.add(
-            cell_range,
-            CellIsRule(operator="equal", formula=['"Yes"'], fill=yes_fill)
-        )
-        ws.conditional_formatting.add(
-            cell_range,
-            CellIsRule(operator="equal", formula=['"No"'], fill=no_fill)
-        )
+        _add_yes_no_rules(ws, cell_range)
 
     # -------------------------
     # session_summary sheet formatting
     # -------------------------
     # Columns: Section | Key | Value  → Value is col C
-    if "session_summary" in writer.sheets:
-        ws = writer.sheets["session_summary"]
-        cell_range = f"C2:C{ws.max_row}"
-        ws.conditional_formatting.add(
-            cell_range,
-            CellIsRule(operator="equal", formula=['"Yes"'], fill=yes_fill)
-        )
-        ws.conditional_formatting.add(
-            cell_range,
-            CellIsRule(operator="equal", formula=['"No"'], fill=no_fill)
-        )
+    if "session_summary" in sheets:
+        ws = sheets["session_summary"]
+        cell_range = f"C2:C{len(frames['session_summary']) + 1}"
+        _add_yes_no_rules(ws, cell_range)
 
-def _apply_static_detail_diff_highlighting(writer, df_details: pd.DataFrame) -> None:
+def _static_detail_diff_styles(df_details: pd.DataFrame) -> Dict:
     """
     Static highlighting rules (NOT conditional formatting):
     - If bench exists for ruling and field differs vs bench: highlight bench cell light green.
     - Else if no bench and regex vs llm differ: highlight regex light red, llm light yellow.
     - No highlight if no disagreement.
-    """
-    from openpyxl.styles import PatternFill
-    from openpyxl.utils import get_column_letter
 
-    ws = writer.sheets["details"]
-
-    fill_bench = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")  # light green
-    fill_regex = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")  # light red
-    fill_llm   = PatternFill(start_color="FFEB9C", end_color="FFEB9C", fill_type="solid")  # light yellow
+    Returns:
+        {(df row position, column position): {"fill": PatternFill}} for _write_sheet.
+        Values are compared as they are written to the sheet (see _excel_value).
+    """
+    styles: Dict = {}
 
-    # Map column name -> excel column index
+    # Map column name -> column position
     cols = list(df_details.columns)
-    col_index = {c: i + 1 for i, c in enumerate(cols)}
+    col_index = {c: i for i, c in enumerate(cols)}
 
     key_cols = {"ruling_id", "extraction_type", "url"}
     value_cols = [c for c in cols if c not in key_cols]
 
-    # Build per-ruling row index lookup: ruling_id -> {extraction_type: excel_row_number}
-    # df_details row 0 is Excel row 2 (row 1 is header)
+    # Build per-ruling row index lookup: ruling_id -> {extraction_type: row position}
+    df_details = df_details.reset_index(drop=True)
+    rids = df_details["ruling_id"].to_numpy()
+    ets = df_details["extraction_type"].to_numpy()
     by_ruling = {}
-    for i, row in df_details.reset_index(drop=True).iterrows():
-        rid = row["ruling_id"]
-        et = row["extraction_type"]
-        excel_row = i + 2
-        by_ruling.setdefault(rid, {})[et] = excel_row
-
-    # For each ruling, decide which comparisons to apply
-    for rid, row_map in by_ruling.items():
-        bench_row = row_map.get("bench")
-        regex_row = row_map.get("regex")
-        llm_row   = row_map.get("llm")
-
-        has_bench = bench_row is not None
-        has_llm = llm_row is not None
-
-        for field in value_cols:
-            c = col_index[field]
-
-            # Pull values (None if row missing)
-            bench_val = ws.cell(row=bench_row, column=c).value if has_bench else None
-            regex_val = ws.cell(row=regex_row, column=c).value if regex_row else None
-            llm_val   = ws.cell(row=llm_row, column=c).value if llm_row else None
-
-            # ---- Case 1: bench exists ----
-            if has_bench:
-                bench_cell = ws.cell(row=bench_row, column=c)
-                bench_cell.fill = fill_bench  # bench is always "as it should be"
-
-                # If regex exists: green if matches bench else red
-                if regex_row:
-                    regex_cell = ws.cell(row=regex_row, column=c)
-                    if regex_val == bench_val:
-                        regex_cell.fill = fill_bench
-                    else:
-                        regex_cell.fill = fill_regex
-
-                # If llm exists: green if matches bench else yellow
-                if llm_row:
-                    llm_cell = ws.cell(row=llm_row, column=c)
-                    if llm_val == bench_val:
-                        llm_cell.fill = fill_bench
-                    else:
-                        llm_cell.fill = fill_llm
-
-            # ---- Case 2: no bench ----
-            else:
-                # Only color if both exist
-                if regex_row and llm_row:
-                    regex_cell = ws.cell(row=regex_row, column=c)
-                    llm_cell = ws.cell(row=llm_row, column=c)
-
-                    if regex_val == llm_val:
-                        regex_cell.fill = fill_bench  # green
-                        llm_cell.fill = fill_bench    # green
-                    else:
-                        regex_cell.fill = fill_regex  # red
-                        llm_cell.fill = fill_llm      # yellow
-                        
+    for i, (rid, et) in enumerate(zip(rids, ets)):
+        by_ruling.setdefault(rid, {})[et] = i
+
+    # One row position per ruling for each extraction type (-1 = row missing)
+    def _positions(et):
+        return np.array([row_map.get(et, -1) for row_map in by_ruling.values()], dtype=np.intp)
+
+    bench_idx, regex_idx, llm_idx = _positions("bench"), _positions("regex"), _positions("llm")
+    has_bench, has_regex, has_llm = bench_idx >= 0, regex_idx >= 0, llm_idx >= 0
+
+    # Value cells as written to the sheet, compared a whole ruling-by-field
+    # block at a time instead of cell by cell
+    # (errstate: NaN cells raise numpy's FP "invalid" flag inside the ufunc)
+    value_pos = sorted({col_index[c] for c in value_cols})
+    with np.errstate(invalid="ignore"):
+        vals = np.frompyfunc(_excel_value, 1, 1)(df_details.iloc[:, value_pos].to_numpy(dtype=object))
+
+    green, red, yellow = {"fill": _FILL_GREEN}, {"fill": _FILL_RED}, {"fill": _FILL_YELLOW}
+
+    def _mark(rows, matches, if_match, if_differ):
+        for r, row_matches in zip(rows.tolist(), matches.tolist()):
+            for c, match in zip(value_pos, row_matches):
+                styles[(r, c)] = if_match if match else if_differ
+
+    # ---- Case 1: bench exists ----
+    # bench is always "as it should be"; regex green if it matches bench else
+    # red, llm green if it matches bench else yellow
+    rows = bench_idx[has_bench]
+    _mark(rows, np.ones((len(rows), len(value_pos)), dtype=bool), green, green)
+    sel = has_bench & has_regex
+    _mark(regex_idx[sel], vals[regex_idx[sel]] == vals[bench_idx[sel]], green, red)
+    sel = has_bench & has_llm
+    _mark(llm_idx[sel], vals[llm_idx[sel]] == vals[bench_idx[sel]], green, yellow)
+
+    # ---- Case 2: no bench ----
+    # Only color if both exist: both green if they agree, else red/yellow
+    sel = ~has_bench & has_regex & has_llm
+    regex_eq_llm = vals[regex_idx[sel]] == vals[llm_idx[sel]]
+    _mark(regex_idx[sel], regex_eq_llm, green, red)
+    _mark(llm_idx[sel], regex_eq_llm, green, yellow)
+
     # Color-code extraction_type column (static fills)
     etype_col = col_index.get("extraction_type")
-    if etype_col:
-        for i, row in df_details.reset_index(drop=True).iterrows():
-            excel_row = i + 2  # header is row 1
-            et = row["extraction_type"]
-
-            cell = ws.cell(row=excel_row, column=etype_col)
-
-            if et == "bench":
-                cell.fill = fill_bench   # green
-            elif et == "regex":
-                cell.fill = fill_regex   # red
-            elif et == "llm":
-                cell.fill = fill_llm     # yellow/orange
-
-
-def _highlight_data_dictionary_replying_person_note(writer) -> None:
-    from openpyxl.styles import PatternFill, Font
+    if etype_col is not None:
+        etype_styles = {"bench": green, "regex": red, "llm": yellow}
+        for i, et in enumerate(ets):
+            style = etype_styles.get(et)
+            if style is not None:
+                styles[(i, etype_col)] = style
 
-    if "data_dictionary" not in writer.sheets:
-        return
+    return styles
 
-    ws = writer.sheets["data_dictionary"]
 
-    yellow = PatternFill(start_color="FFFF00", end_color="FFFF00", fill_type="solid")
-    black_font = Font(color="000000")
+def _data_dictionary_note_styles(df_dict: pd.DataFrame) -> Dict:
+    """Yellow fill + black font for the notes cell of the replying_person row(s)."""
+    note_style = {"fill": _FILL_NOTE, "font": _FONT_BLACK}
 
     # Find the "field" and "notes" columns by header name
-    header = [c.value for c in ws[1]]
+    header = list(df_dict.columns)
     try:
-        field_col = header.index("field") + 1
-        notes_col = header.index("notes") + 1
+        field_col = header.index("field")
+        notes_col = header.index("notes")
     except ValueError:
-        return
+        return {}
 
     # For each row where field == replying_person, highlight notes cell
-    for r in range(2, ws.max_row + 1):
-        if ws.cell(row=r, column=field_col).value == "replying_person":
-            cell = ws.cell(row=r, column=notes_col)
-            cell.fill = yellow
-            cell.font = black_font
-
-def _autosize_notes_column(writer, sheet_name: str = "data_dictionary", max_width: int = 90) -> None:
-    from openpyxl.utils import get_column_letter
-
-    if sheet_name not in writer.sheets:
-        return
+    return {
+        (i, notes_col): note_style
+        for i, field in enumerate(df_dict.iloc[:, field_col])
+        if field == "replying_person"
+    }
 
-    ws = writer.sheets[sheet_name]
-    header = [c.value for c in ws[1]]
+def _notes_column_width(df: pd.DataFrame, max_width: int = 90) -> Dict[str, float]:
+    """{column letter: width} for the "notes" column, sized to its longest line."""
+    header = list(df.columns)
     try:
         notes_col = header.index("notes") + 1
     except ValueError:
-        return
-
-    # Compute max visible length in notes column
-    max_len = 0
-    for r in range(1, ws.max_row + 1):
-        v = ws.cell(row=r, column=notes_col).value
-        if v is None:
-            continue
-        # Consider longest line if there are line breaks
-        s = str(v)
-        s = max(s.splitlines(), key=len) if "\n" in s or "\r" in s else s
-        max_len = max(max_len, len(s))
+        return {}
+
+    # Compute max visible length in notes column (header included), taking the
+    # longest line of multi-line cells; empty cells contribute no lines
+    max_len = max(
+        (len(line) for v in ["notes", *df["notes"]] for line in str(_excel_value(v)).splitlines()),
+        default=0,
+    )
 
     # Rough Excel width heuristic
     width = min(max(12, int(max_len * 1.1) + 2), max_width)
-    ws.column_dimensions[get_column_letter(notes_col)].width = width
-
-def _disable_gridlines(writer) -> None:
-    for ws in writer.book.worksheets:
-        ws.sheet_view.showGridLines = False
+    return {get_column_letter(notes_col): width}
 
 
 def _read_last_jsonl_line(path: str) -> dict:
@@ -736,7 +755,7 @@ def _read_last_jsonl_line(path: str) -> dict:
                 if not line:
                     continue
                 try:
-                    last = json.loads(line)
+                    last = json_loads(line)
                 except json.JSONDecodeError:
                     continue
             return last
@@ -839,7 +858,7 @@ def _build_id_scrape_results_df(base_dir: Optional[str], jurisdiction: str) -> p
                     if not line:
                         continue
                     try:
-                        obj = json.loads(line)
+                        obj = json_loads(line)
                     except json.JSONDecodeError:
                         continue
                     if obj.get("type") == "session_summary":
@@ -927,9 +946,11 @@ def export_to_excel(
         timestamp=timestamp
     )
     df_dict = _build_data_dictionary_df(bench_spec)
-    df_summary = _build_summary_df(triage, bench_values_dict)
+    # Summary and details rows share one ruling_id order
+    ruling_ids = sorted(triage)
+    df_summary = _build_summary_df(triage, bench_values_dict, ruling_ids)
     df_details = _build_details_df(
-        triage=triage,
+        ruling_ids=ruling_ids,
         bench_spec=bench_spec,
         regex_records=regex_records,
         llm_records=llm_records,
@@ -937,35 +958,36 @@ def export_to_excel(
     )
 
     # Write to Excel — sheet order: session_summary, id_scrape_results, metadata,
-    # data_dictionary, summary, details
-    with pd.ExcelWriter(output_path, engine="openpyxl") as writer:
-        df_session_summary.to_excel(writer, sheet_name="session_summary", index=False)
-        df_scrape_results.to_excel(writer, sheet_name="id_scrape_results", index=False)
-        df_metadata.to_excel(writer, sheet_name="metadata", index=False)
-        df_dict.to_excel(writer, sheet_name="data_dictionary", index=False)
-        df_summary.to_excel(writer, sheet_name="summary", index=False)
-        df_details.to_excel(writer, sheet_name="details", index=False)
-
-        # Apply table formatting and styling
-        _apply_table_formatting(writer, "session_summary", df_session_summary)
-        _apply_table_formatting(writer, "id_scrape_results", df_scrape_results)
-        _apply_table_formatting(writer, "metadata", df_metadata)
-        _apply_table_formatting(writer, "data_dictionary", df_dict)
-        _apply_table_formatting(writer, "summary", df_summary)
-
-        print(df_details.columns[df_details.columns.duplicated()].tolist())
-        _apply_table_formatting(writer, "details", df_details)
-
-        # Apply conditional formatting
-        _apply_conditional_formatting(writer)
-        _apply_static_detail_diff_highlighting(writer, df_details)
-        _highlight_data_dictionary_replying_person_note(writer)
-
-        # Apply Other Stylistic Choices
-        _disable_gridlines(writer)
-        _autosize_notes_column(writer, "data_dictionary")
+    # data_dictionary, summary, details.
+    # Write-only workbook: rows are streamed to XML as they are appended instead
+    # of building every Cell in memory and then restyling it, so all per-cell
+    # formatting (header, alignment, static fills) is decided up front.
+
+    frames = {
+        "session_summary": df_session_summary,
+        "id_scrape_results": df_scrape_results,
+        "metadata": df_metadata,
+        "data_dictionary": df_dict,
+        "summary": df_summary,
+        "details": df_details,
+    }
+    cell_styles = {
+        "data_dictionary": _data_dictionary_note_styles(df_dict),
+        "details": _static_detail_diff_styles(df_details),
+    }
+    widths = {"data_dictionary": _notes_column_width(df_dict)}
+
+    wb = Workbook(write_only=True)
+    sheets = {
+        name: _write_sheet(wb, name, df, cell_styles.get(name), widths.get(name))
+        for name, df in frames.items()
+    }
+
+    # Apply conditional formatting
+    _apply_conditional_formatting(sheets, frames)
+
+    wb.save(output_path)
 
-    
     print(f"✓ Excel export: {output_path}")
     print(f"  - summary: {len(df_summary)} ruling(s)")
     print(f"  - details: {len(df_details)} extraction record(s)")
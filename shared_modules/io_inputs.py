@@ -13,17 +13,24 @@ rest of the pipeline independent of file formats.
 
 
 import csv
+import importlib.util
 import json
 import os
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Tuple
+
+from shared_modules.utils import _pandas, json_loads
 
 
 # Optional dependency: XLSX support requires pandas (and typically openpyxl).
-# If pandas is not installed, XLSX inputs will raise a clear ImportError.
-try:
-    import pandas as pd
-except ImportError:
-    pd = None
+# pandas is imported only when an XLSX input is actually read (it is slow to
+# import); if it is not installed, XLSX inputs raise a clear ImportError.
+# If python-calamine is installed, pandas reads the sheet with it instead of
+# openpyxl (a Rust parser, several times faster on large sheets).
+
+
+def _excel_engine() -> Optional[str]:
+    """Return "calamine" if python-calamine is installed, else None (pandas default)."""
+    return "calamine" if importlib.util.find_spec("python_calamine") is not None else None
 
 
 # =========================
@@ -45,23 +52,31 @@ def _normalize_ruling_ids(items: List[str]) -> List[str]:
     Returns:
         List of cleaned ruling-id strings.
     """
-    cleaned = []
-    seen = set()
+    as_str = [rid if isinstance(rid, str) else str(rid) for rid in items if rid is not None]
+
+    # dict.fromkeys keeps the first occurrence of each ID, in input order
+    cleaned = dict.fromkeys(map(str.strip, as_str))
+    cleaned.pop("", None)
+    return list(cleaned)
+
 
-    for rid in items:
-        if rid is None:
-            continue
-        if not isinstance(rid, str):
-            rid = str(rid)
+# Header spellings accepted for the ruling ID column (after _header_key)
+_RULING_ID_HEADERS = ("ruling_id", "rulingid")
 
-        rid2 = rid.strip()
-        if not rid2 or rid2 in seen:
-            continue
 
-        seen.add(rid2)
-        cleaned.append(rid2)
+def _header_key(header: str) -> str:
+    """Normalize a column header for matching: trimmed, lowercase, '-'/' ' -> '_'."""
+    return header.strip().lower().replace("-", "_").replace(" ", "_")
 
-    return cleaned
+
+def _ruling_id_column(headers) -> Optional[int]:
+    """
+    Return the position of the ruling ID column in `headers`, or None.
+
+    Non-string headers are ignored. If a spelling repeats, its last column wins.
+    """
+    keys = {_header_key(h): i for i, h in enumerate(headers) if isinstance(h, str)}
+    return next((keys[k] for k in _RULING_ID_HEADERS if k in keys), None)
 
 
 def load_ruling_ids(base_dir: str, fallback: List[str], jurisdiction: str = "ny") -> Tuple[List[str], str]:
@@ -82,6 +97,7 @@ def load_ruling_ids(base_dir: str, fallback: List[str], jurisdiction: str = "ny"
 
     Returns:
         Tuple of (normalized list of ruling IDs, source description string).
+        The list never contains duplicates, whichever source it came from.
     """
     rulings_dir = os.path.join(base_dir, "input_data", jurisdiction, "ruling_ids")
     jsonl_path = os.path.join(rulings_dir, f"{jurisdiction}_ruling_ids_scraper.jsonl")
@@ -100,7 +116,7 @@ def load_ruling_ids(base_dir: str, fallback: List[str], jurisdiction: str = "ny"
                 if not line:
                     continue
                 try:
-                    obj = json.loads(line)
+                    obj = json_loads(line)
                 except json.JSONDecodeError:
                     continue
                 if obj.get("type") == "session_summary":
@@ -116,8 +132,8 @@ def load_ruling_ids(base_dir: str, fallback: List[str], jurisdiction: str = "ny"
     # - A list: ["N340865", ...]
     # - A dict with a "ruling_ids" list: {"ruling_ids": [...]}
     if os.path.exists(json_path):
-        with open(json_path, "r", encoding="utf-8") as f:
-            obj = json.load(f)
+        with open(json_path, "rb") as f:
+            obj = json_loads(f.read())
 
         if isinstance(obj, list):
             ids = _normalize_ruling_ids(obj)
@@ -135,19 +151,23 @@ def load_ruling_ids(base_dir: str, fallback: List[str], jurisdiction: str = "ny"
     # - Headerless CSV where the first column contains ruling IDs.
     if os.path.exists(csv_path):
         ids = []
-        with open(csv_path, newline="", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            if reader.fieldnames:
+        # utf-8-sig drops the BOM Excel writes, which would otherwise hide a
+        # ruling_id header in the first column
+        with open(csv_path, newline="", encoding="utf-8-sig", buffering=1 << 20) as f:
+            # Plain csv.reader indexed by column position: no per-row dict
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if header:
                 # Prefer named columns if present; otherwise use the first column.
-                lowered = {h.lower(): h for h in reader.fieldnames}
-                col = lowered.get("ruling_id") or lowered.get("ruling_id") or reader.fieldnames[0]
+                idx = _ruling_id_column(header)
+                if idx is None:
+                    idx = 0
                 for row in reader:
-                    ids.append(row.get(col))
+                    if len(row) > idx:
+                        ids.append(row[idx])
             else:
                 # No header: read first column.
-                f.seek(0)
-                raw = csv.reader(f)
-                for row in raw:
+                for row in reader:
                     if row:
                         ids.append(row[0])
 
@@ -158,18 +178,21 @@ def load_ruling_ids(base_dir: str, fallback: List[str], jurisdiction: str = "ny"
     # Reads the first sheet by default. Prefers a "ruling_id" column if present;
     # otherwise uses the first column in the sheet.
     if os.path.exists(xlsx_path):
+        pd = _pandas()
         if pd is None:
             raise ImportError("Excel ruling IDs found but pandas is not installed. Install: pip install pandas openpyxl")
 
-        df = pd.read_excel(xlsx_path)  # first sheet by default
+        df = pd.read_excel(xlsx_path, engine=_excel_engine())  # first sheet by default
         if df.shape[1] == 0:
             ids = _normalize_ruling_ids([])
             return ids, f"Excel file (ruling_ids.xlsx) — {len(ids)} rulings"
 
         # Prefer named columns; otherwise first column.
-        cols = {c.lower(): c for c in df.columns if isinstance(c, str)}
-        col = cols.get("ruling_id") or cols.get("ruling_id") or df.columns[0]
-        ids = _normalize_ruling_ids(df[col].tolist())
+        pos = _ruling_id_column(df.columns)
+        col = df.columns[pos if pos is not None else 0]
+        # Empty cells come back as NaN; drop them in pandas before the
+        # per-ID cleanup (str(NaN) would otherwise yield a "nan" ruling ID)
+        ids = _normalize_ruling_ids(df[col].dropna().tolist())
         return ids, f"Excel file (ruling_ids.xlsx) — {len(ids)} rulings"
 
     # 4) Fallback
@@ -195,8 +218,8 @@ def load_benchmark_spec(base_dir: str, jurisdiction: str = "ny") -> dict:
         jurisdiction: Jurisdiction subfolder name (e.g. "ny", "ca").
     """
     path = os.path.join(base_dir, "input_data", jurisdiction, "benchmarks", "benchmark_spec.json")
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    with open(path, "rb") as f:
+        return json_loads(f.read())
 
 
 def load_benchmark_values(base_dir: str, jurisdiction: str = "ny") -> List[Dict]:
@@ -211,5 +234,5 @@ def load_benchmark_values(base_dir: str, jurisdiction: str = "ny") -> List[Dict]
         List of goal-schema records keyed by `ruling_id`, used for evaluation.
     """
     path = os.path.join(base_dir, "input_data", jurisdiction, "benchmarks", "benchmark_values.json")
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    with open(path, "rb") as f:
+        return json_loads(f.read())
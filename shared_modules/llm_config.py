@@ -12,6 +12,7 @@ PROVIDERS = {
     "openai": {
         "api_key_env": "OPENAI_API_KEY",
         "base_url": "https://api.openai.com/v1",
+        "json_schema": True,   # supports response_format={"type": "json_schema", ...}
     },
     "deepinfra": {
         "api_key_env": "DEEPINFRA_API_KEY", 
@@ -40,3 +41,17 @@ LLM_PRICING = {
         }
     }
 }
+
+# Same rates keyed by (provider, model): one lookup, no per-provider default dict
+PRICING_FLAT = {
+    (provider, model): rates
+    for provider, models in LLM_PRICING.items()
+    for model, rates in models.items()
+}
+
+# Per-token rates in integer nano-USD (1e-9 $): USD per 1K tokens * 1e9 / 1000.
+# Integer costs add up exactly, however many calls a run makes.
+PRICING_NANO = {
+    key: (round(rates["input_per_1k"] * 1_000_000), round(rates["output_per_1k"] * 1_000_000))
+    for key, rates in PRICING_FLAT.items()
+}
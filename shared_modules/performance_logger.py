@@ -11,16 +11,27 @@ Log files (all in output_data/<jurisdiction>/performance_logs/):
   log_extract_llm.jsonl      - One row per ruling LLM call
 """
 
-import json
+import atexit
 import os
 from datetime import datetime
 from typing import Optional
-from shared_modules.llm_config import LLM_PRICING
+from shared_modules.llm_config import PRICING_NANO
+from shared_modules.utils import json_line
 
 
 class PerformanceLogger:
     """Collects and logs performance metrics for ruling extraction runs."""
 
+    # Fixed attribute set: counters are updated on every tracked event
+    __slots__ = (
+        "log_dir", "session_start", "session_id",
+        "total_rulings", "new_rulings", "cached_rulings",
+        "total_fetch_sec", "total_rx_sec", "total_llm_sec",
+        "llm_enabled", "llm_provider", "llm_model",
+        "total_input_tokens", "total_output_tokens", "total_cost_nano",
+        "_llm_rates", "_files",
+    )
+
     def __init__(self, log_dir: str):
         """
         Initialize logger with output directory (not a single file path).
@@ -48,6 +59,14 @@ class PerformanceLogger:
         self.llm_model = None
         self.total_input_tokens = 0
         self.total_output_tokens = 0
+        self.total_cost_nano = 0  # integer nano-USD, exact
+        # (provider, model, nano-USD per input token, nano-USD per output token),
+        # looked up in PRICING_NANO when the provider/model is first seen
+        self._llm_rates = None
+
+        # Log file handles, opened on first append and kept for the run
+        self._files = {}
+        atexit.register(self.close)
 
     # ------------------------------------------------------------------
     # Per-ruling tracking methods
@@ -100,8 +119,12 @@ class PerformanceLogger:
         self.total_input_tokens += input_tokens
         self.total_output_tokens += output_tokens
 
-        pricing = LLM_PRICING.get(provider, {}).get(model, {"input_per_1k": 0.0, "output_per_1k": 0.0})
-        cost = (input_tokens / 1000 * pricing["input_per_1k"]) + (output_tokens / 1000 * pricing["output_per_1k"])
+        rates = self._llm_rates
+        if rates is None or rates[0] != provider or rates[1] != model:
+            rates = self._llm_rates = (provider, model, *PRICING_NANO.get((provider, model), (0, 0)))
+        cost_nano = input_tokens * rates[2] + output_tokens * rates[3]
+        self.total_cost_nano += cost_nano
+        cost = cost_nano / 1e9
 
         elapsed = (end - start).total_seconds() if start and end else None
         if elapsed is not None:
@@ -127,21 +150,18 @@ class PerformanceLogger:
     # ------------------------------------------------------------------
 
     def calculate_cost(self) -> float:
-        """Calculate total LLM cost in USD."""
-        if not self.llm_enabled or not self.llm_provider or not self.llm_model:
-            return 0.0
-        pricing = LLM_PRICING.get(self.llm_provider, {}).get(self.llm_model)
-        if not pricing:
-            return 0.0
-        input_cost = (self.total_input_tokens / 1000) * pricing["input_per_1k"]
-        output_cost = (self.total_output_tokens / 1000) * pricing["output_per_1k"]
-        return input_cost + output_cost
+        """Total LLM cost in USD (accumulated per call by track_llm_call)."""
+        return self.total_cost_nano / 1e9
 
     def write_log(self, jurisdiction: str):
         """Write session summary to log_extract_session.jsonl and print console summary."""
         n = self.total_rulings
         total_cost = self.calculate_cost()
 
+        def per_ruling(total, ndigits=4, empty=0.0):
+            """Rounded per-ruling average; `empty` when no rulings were tracked."""
+            return round(total / n, ndigits) if n > 0 else empty
+
         log_entry = {
             "session_id": self.session_id,
             "timestamp": self.session_start.isoformat(),
@@ -149,15 +169,15 @@ class PerformanceLogger:
             "total_rulings": n,
             "new_rulings": self.new_rulings,
             "cached_rulings": self.cached_rulings,
-            "cache_hit_rate": round(self.cached_rulings / n, 4) if n > 0 else 0.0,
+            "cache_hit_rate": per_ruling(self.cached_rulings),
             "llm_enabled": self.llm_enabled,
             "timing": {
                 "total_fetch_sec": round(self.total_fetch_sec, 2),
-                "avg_fetch_sec": round(self.total_fetch_sec / n, 4) if n > 0 else 0.0,
+                "avg_fetch_sec": per_ruling(self.total_fetch_sec),
                 "total_rx_sec": round(self.total_rx_sec, 2),
-                "avg_rx_sec": round(self.total_rx_sec / n, 4) if n > 0 else 0.0,
+                "avg_rx_sec": per_ruling(self.total_rx_sec),
                 "total_llm_sec": round(self.total_llm_sec, 2),
-                "avg_llm_sec": round(self.total_llm_sec / n, 4) if n > 0 else 0.0,
+                "avg_llm_sec": per_ruling(self.total_llm_sec),
             },
         }
 
@@ -167,13 +187,14 @@ class PerformanceLogger:
             log_entry["llm_metrics"] = {
                 "total_input_tokens": self.total_input_tokens,
                 "total_output_tokens": self.total_output_tokens,
-                "avg_input_tokens_per_ruling": round(self.total_input_tokens / n, 0) if n > 0 else 0,
-                "avg_output_tokens_per_ruling": round(self.total_output_tokens / n, 0) if n > 0 else 0,
+                "avg_input_tokens_per_ruling": per_ruling(self.total_input_tokens, 0, 0),
+                "avg_output_tokens_per_ruling": per_ruling(self.total_output_tokens, 0, 0),
                 "total_cost_usd": round(total_cost, 4),
-                "avg_cost_per_ruling_usd": round(total_cost / n, 4) if n > 0 else 0.0,
+                "avg_cost_per_ruling_usd": per_ruling(total_cost),
             }
 
         self._append("log_extract_session.jsonl", log_entry)
+        self.close()
 
         # Console summary
         session_log_path = os.path.join(self.log_dir, "log_extract_session.jsonl")
@@ -188,12 +209,24 @@ class PerformanceLogger:
             print(f"  - Avg cost per ruling:   ${log_entry['llm_metrics']['avg_cost_per_ruling_usd']:.4f}")
 
     # ------------------------------------------------------------------
-    # Internal helper
+    # Internal helpers / file handling
     # ------------------------------------------------------------------
 
     def _append(self, filename: str, entry: dict):
-        """Append one JSON entry to a log file in log_dir."""
-        os.makedirs(self.log_dir, exist_ok=True)
-        path = os.path.join(self.log_dir, filename)
-        with open(path, "a", encoding="utf-8") as f:
-            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        """Append one JSON entry to a log file in log_dir.
+
+        The file stays open between events; each entry is flushed as it is
+        written, so a crash still leaves every completed line on disk.
+        """
+        f = self._files.get(filename)
+        if f is None:
+            os.makedirs(self.log_dir, exist_ok=True)
+            f = self._files[filename] = open(os.path.join(self.log_dir, filename), "ab")
+        f.write(json_line(entry))
+        f.flush()
+
+    def close(self):
+        """Close any open log files (safe to call more than once)."""
+        for f in self._files.values():
+            f.close()
+        self._files.clear()
@@ -14,9 +14,66 @@ consistent across reports (especially around `replying_person`).
 """
 
 
-from typing import Dict, List
+from typing import TYPE_CHECKING, Dict, List
 
-from shared_modules.utils import collapse_ws
+from shared_modules.utils import collapse_ws_cached, normalize_records
+
+# numpy/pandas are only needed by the vectorized benchmark/disagreement
+# reports, so they are imported inside those functions; the triage report
+# (the one main.py runs) works on plain dicts and skips their import cost.
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+# =========================
+# COMPARISON HELPERS
+# =========================
+# Each record's comparison values are computed once up front, so the per-field
+# loops below are plain dict lookups rather than repeated string normalization.
+
+
+def _normalize_record(rec: Dict, fields: List[str], exempt=("replying_person",)) -> Dict[str, object]:
+    """
+    Return {field: comparison value} for one record.
+
+    String values are whitespace-collapsed, except for fields in `exempt`, which
+    are compared exactly. Missing fields map to None.
+    """
+    out = {}
+    for f in fields:
+        v = rec.get(f)
+        out[f] = collapse_ws_cached(v) if isinstance(v, str) and f not in exempt else v
+    return out
+
+
+def _normalized_by_id(records: List[Dict], fields: List[str], exempt=("replying_person",)) -> Dict[str, Dict[str, object]]:
+    """Index records by ruling_id with comparison values from `_normalize_record`."""
+    return {r.get("ruling_id"): _normalize_record(r, fields, exempt) for r in records}
+
+
+def _aligned_diffs(left: "pd.DataFrame", right_records: List[Dict], fields: List[str], exempt=("replying_person",)):
+    """
+    Align `left` to the right-hand records by ruling_id and diff every cell at once.
+
+    Rows of `left` without a ruling_id, or without a matching right-hand record,
+    are dropped. The right side keeps the last record per ruling_id, matching the
+    dict lookups used elsewhere in this module.
+
+    Returns:
+        (ruling_ids, left_values, right_values, diff_mask) where the value arrays
+        and mask have shape (len(ruling_ids), len(fields)).
+    """
+    import numpy as np
+
+    right = normalize_records(right_records, fields, skip=exempt)
+    right = right.loc[~right.index.duplicated(keep="last")]
+
+    keep = np.array([bool(rid) and rid in right.index for rid in left.index], dtype=bool)
+    left = left.loc[keep]
+
+    left_vals = left.to_numpy()
+    right_vals = right.reindex(left.index).to_numpy()
+    return left.index, left_vals, right_vals, left_vals != right_vals
 
 
 # =========================
@@ -55,35 +112,23 @@ def compare_to_benchmark(
     - Applies whitespace collapsing to string fields for stable comparisons, except
       `replying_person` which is treated as whitespace-sensitive per the spec.
     """
-    fields = bench_spec["output"]["field_order"]
-    bench_by_id = {r.get("ruling_id"): r for r in bench_values}
-
-    report: Dict[str, Dict[str, Dict[str, object]]] = {}
-    for pred in predicted_raw_records:
-        rid = pred.get("ruling_id")
-        bench = bench_by_id.get(rid)
-        if not rid or not bench:
-            continue
-
-        diffs = {}
-        for k in fields:
-            pv = pred.get(k)
-            iv = bench.get(k)
+    import numpy as np
 
-            # Apply the same whitespace normalization as elsewhere in the pipeline.
-            # `replying_person` is intentionally excluded because the benchmark
-            # often expects exact formatting (e.g., line breaks / <br> behavior).
-            if isinstance(pv, str) and k != "replying_person":
-                pv = collapse_ws(pv)
-            if isinstance(iv, str) and k != "replying_person":
-                iv = collapse_ws(iv)
+    fields = bench_spec["output"]["field_order"]
 
-            # Only record differences; matching fields are omitted from the output.
-            if pv != iv:
-                diffs[k] = {pred_label: pv, "bench": iv}
+    # Apply the same whitespace normalization as elsewhere in the pipeline.
+    # `replying_person` is intentionally excluded because the benchmark
+    # often expects exact formatting (e.g., line breaks / <br> behavior).
+    pred_df = normalize_records(predicted_raw_records, fields)
+    rids, pred_vals, bench_vals, mask = _aligned_diffs(pred_df, bench_values, fields)
 
-        if diffs:
-            report[rid] = diffs
+    # Only record differences; matching fields are omitted from the output.
+    report: Dict[str, Dict[str, Dict[str, object]]] = {}
+    for i in np.flatnonzero(mask.any(axis=1)):
+        report[rids[i]] = {
+            fields[j]: {pred_label: pred_vals[i, j], "bench": bench_vals[i, j]}
+            for j in np.flatnonzero(mask[i])
+        }
 
     return report
 
@@ -105,33 +150,18 @@ def disagreement_report_goal(regex_goal: List[Dict], llm_goal: List[Dict], bench
     - Whitespace is collapsed for string comparisons to avoid noise from
       formatting differences.
     """
-    fields = bench_spec["output"]["field_order"]
-    by_id_llm = {r.get("ruling_id"): r for r in llm_goal}
-
-    report: Dict[str, List[str]] = {}
-    for rr in regex_goal:
-        rid = rr.get("ruling_id")
-        lr = by_id_llm.get(rid)
-        if not rid or not lr:
-            continue
-
-        diffs = []
-        for k in fields:
-            rv = rr.get(k)
-            lv = lr.get(k)
+    import numpy as np
 
-            # Normalize whitespace for stability (this function does not special-case
-            # replying_person because the output is just a “fields differ” list).
-            if isinstance(rv, str):
-                rv = collapse_ws(rv)
-            if isinstance(lv, str):
-                lv = collapse_ws(lv)
+    fields = bench_spec["output"]["field_order"]
 
-            if rv != lv:
-                diffs.append(k)
+    # Normalize whitespace for stability (this function does not special-case
+    # replying_person because the output is just a “fields differ” list).
+    regex_df = normalize_records(regex_goal, fields, skip=())
+    rids, _, _, mask = _aligned_diffs(regex_df, llm_goal, fields, exempt=())
 
-        if diffs:
-            report[rid] = diffs
+    report: Dict[str, List[str]] = {}
+    for i in np.flatnonzero(mask.any(axis=1)):
+        report[rids[i]] = [fields[j] for j in np.flatnonzero(mask[i])]
 
     return report
 
@@ -174,6 +204,11 @@ def triage_report_goal(
     by_id_llm = {r.get("ruling_id"): r for r in llm_raw_records}
     by_id_bench = {r.get("ruling_id"): r for r in bench_values}
 
+    # Comparison values: collapse whitespace for stability, but keep
+    # replying_person exact (formatting-sensitive). Computed once per record.
+    llm_norm = _normalized_by_id(llm_raw_records, fields)
+    bench_norm = _normalized_by_id(bench_values, fields)
+
     report: Dict[str, Dict[str, Dict[str, object]]] = {}
     for regex_rec in regex_raw_records:
         ruling_id = regex_rec.get("ruling_id")
@@ -186,17 +221,19 @@ def triage_report_goal(
         # Benchmark may not exist for every ruling id (depending on the dataset split).
         bench_rec = by_id_bench.get(ruling_id)  # may be None
 
+        regex_cmp_rec = _normalize_record(regex_rec, fields)
+        llm_cmp_rec = llm_norm.get(ruling_id)
+        bench_cmp_rec = bench_norm.get(ruling_id)
+
         diffs: Dict[str, Dict[str, object]] = {}
         for field in fields:
             regex_val = regex_rec.get(field)
             llm_val = llm_rec.get(field) if llm_rec else None
             bench_val = bench_rec.get(field) if bench_rec else None
 
-            # Comparison values: collapse whitespace for stability, but keep
-            # replying_person exact (formatting-sensitive).
-            regex_cmp = collapse_ws(regex_val) if isinstance(regex_val, str) and field != "replying_person" else regex_val
-            llm_cmp = collapse_ws(llm_val) if isinstance(llm_val, str) and field != "replying_person" else llm_val
-            bench_cmp = collapse_ws(bench_val) if isinstance(bench_val, str) and field != "replying_person" else bench_val
+            regex_cmp = regex_cmp_rec[field]
+            llm_cmp = llm_cmp_rec[field] if llm_cmp_rec is not None else None
+            bench_cmp = bench_cmp_rec[field] if bench_cmp_rec is not None else None
 
             # Pairwise comparisons used to decide whether the field is triage-worthy.
             regex_vs_llm = (llm_rec is not None) and (regex_cmp != llm_cmp)
@@ -11,7 +11,27 @@ Supports both regex and LLM extraction workflows.
 import json
 import os
 import re
-from typing import Optional, List
+from functools import lru_cache
+from typing import Dict, Optional, List, Pattern, Union
+
+
+# Optional dependency: orjson parses/serializes JSON several times faster than
+# the stdlib. Output has the same layout (UTF-8, 2-space indent), so it is used
+# when installed and the stdlib json module otherwise.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+
+# Precompiled patterns for the hot normalization/matching helpers below.
+_WS_RE = re.compile(r"\s+")
+# Space/tab runs that normalize_text must rewrite: any run holding a tab or
+# longer than one char. A lone " " is already normalized, so skipping it
+# avoids a no-op substitution at every word gap (same result as [ \t]+).
+_HSPACE_RE = re.compile(r"(?:\t| (?=[ \t]))[ \t]*")
+_MULTI_NL_RE = re.compile(r"\n{3,}")
 
 
 # =========================
@@ -27,9 +47,75 @@ def ensure_dir(path: str) -> None:
 
 def read_text(path: str) -> str:
     """Safely read UTF-8 text file. 
-    Used for loading pretty-printed CBP rulings."""
-    with open(path, "r", encoding="utf-8") as f:
-        return f.read()
+    Used for loading pretty-printed CBP rulings.
+
+    Reads the whole file in one binary read and decodes once, instead of going
+    through the buffered text layer. Line endings are normalized to "\n" the
+    same way text mode would (caches written on Windows contain "\r\n")."""
+    with open(path, "rb") as f:
+        text = f.read().decode("utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def json_loads(s: Union[str, bytes]):
+    """Parse a JSON document (orjson when available).
+    Decode errors are json.JSONDecodeError in both cases."""
+    if orjson is not None:
+        return orjson.loads(s)
+    return json.loads(s)
+
+
+def json_line(obj) -> bytes:
+    """Serialize `obj` as one compact JSON Lines record (orjson when available).
+    Returns UTF-8 bytes ending in a newline; non-ASCII text is kept as-is, as
+    with json.dumps(..., ensure_ascii=False)."""
+    if orjson is not None:
+        return orjson.dumps(obj) + b"\n"
+    return (json.dumps(obj, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+def _write_json_orjson(obj, path: str) -> None:
+    """orjson half of write_json; raises orjson.JSONEncodeError on values it cannot encode.
+
+    Top-level lists/dicts are streamed one entry at a time, so a large record
+    list is never held as a second, fully serialized copy in memory (json.dump
+    already writes incrementally)."""
+    opt = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+    with open(path, "wb") as f:
+        if isinstance(obj, (list, dict)) and obj:
+            # Dump each entry wrapped in a one-item container and strip the
+            # brackets: the entry comes out already indented one level.
+            if isinstance(obj, list):
+                head, tail, entries = b"[\n", b"\n]", ([v] for v in obj)
+            else:
+                head, tail, entries = b"{\n", b"\n}", ({k: v} for k, v in obj.items())
+            f.write(head)
+            for i, entry in enumerate(entries):
+                if i:
+                    f.write(b",\n")
+                f.write(orjson.dumps(entry, option=opt)[2:-2])
+            f.write(tail)
+        else:
+            f.write(orjson.dumps(obj, option=opt))
+
+
+def write_json(obj, path: str) -> None:
+    """Write `obj` as indented UTF-8 JSON (orjson when available).
+    Same layout as json.dump(..., ensure_ascii=False, indent=2), with non-string
+    dict keys stringified the way json.dump does, but not byte-identical:
+    orjson writes NaN/Infinity as null and some floats differently (1e20, not
+    1e+20). Values orjson rejects (e.g. ints beyond 64 bits) fall back to
+    json.dump, which rewrites the file from the start."""
+    if orjson is not None:
+        try:
+            _write_json_orjson(obj, path)
+            return
+        except orjson.JSONEncodeError:
+            pass
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(obj, f, ensure_ascii=False, indent=2)
 
 
 def load_json_if_exists(path: str):
@@ -37,8 +123,74 @@ def load_json_if_exists(path: str):
     Graceful fallback for missing benchmark files or previous results."""
     if not os.path.exists(path):
         return None
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    with open(path, "rb") as f:
+        return json_loads(f.read())
+
+
+def _pandas():
+    """Import pandas on first use (it is slow to import and optional here).
+    Columnar record files need pandas + a Parquet engine (pyarrow); without
+    them, record files are written/read as JSON only."""
+    try:
+        import pandas as pd
+    except ImportError:
+        return None
+    return pd
+
+
+def _parquet_sibling(path: str) -> str:
+    """Return the `.parquet` path that sits next to a `.json` record file."""
+    return os.path.splitext(path)[0] + ".parquet"
+
+
+def _text_only(records: List[Dict]) -> bool:
+    """True if every record value is a str or None (the only values that
+    round-trip through Parquet unchanged: lists come back as numpy arrays,
+    nullable ints as floats)."""
+    return all(v is None or isinstance(v, str) for rec in records for v in rec.values())
+
+
+def save_records(records: List[Dict], path: str) -> None:
+    """Write extracted records to `path` as JSON, plus a Parquet sibling when possible.
+
+    The JSON file stays the canonical, human-readable output. The Parquet copy
+    is much faster to reload on large runs; it is skipped silently when pandas
+    or a Parquet engine is not installed, or when a record holds a non-text
+    value (see `_text_only`)."""
+    write_json(records, path)
+
+    pq_path = _parquet_sibling(path)
+    pd = _pandas() if records and _text_only(records) else None
+    if pd is not None:
+        try:
+            pd.DataFrame(records).to_parquet(pq_path, compression="zstd", index=False)
+            return
+        except Exception:
+            pass  # optional copy: no Parquet engine, an Arrow type error, ...
+    # No fresh Parquet copy: drop any stale sibling so readers fall back to the JSON file
+    if os.path.exists(pq_path):
+        os.remove(pq_path)
+
+
+def load_records(path: str) -> Optional[List[Dict]]:
+    """Load records saved by `save_records`, preferring the Parquet sibling.
+
+    Falls back to the JSON file when the Parquet copy is missing, older than the
+    JSON, or cannot be read. Returns None if neither file exists."""
+    pq_path = _parquet_sibling(path)
+    pd = _pandas() if os.path.exists(pq_path) else None
+    if (
+        pd is not None
+        and (not os.path.exists(path) or os.path.getmtime(pq_path) >= os.path.getmtime(path))
+    ):
+        try:
+            df = pd.read_parquet(pq_path)
+        except Exception:
+            pass  # no Parquet engine, or an unreadable file: use the JSON
+        else:
+            # Parquet nulls come back as NaN; restore None so records match the JSON form
+            return df.astype(object).where(df.notna(), None).to_dict(orient="records")
+    return load_json_if_exists(path)
 
 
 # =========================
@@ -53,7 +205,54 @@ def collapse_ws(s: str) -> str:
     
     Used everywhere to normalize extracted text before comparison.
     """
-    return " ".join(s.split()).strip()
+    # Fast path: most values are already collapsed. isprintable() is False for
+    # every whitespace character except the ASCII space, so this is exactly
+    # "no whitespace other than single inner spaces" and `s` is returned as-is.
+    if s.isprintable() and "  " not in s and s[:1] != " " and s[-1:] != " ":
+        return s
+    # split() with no args already drops leading/trailing whitespace
+    return " ".join(s.split())
+
+
+@lru_cache(maxsize=4096)
+def collapse_ws_cached(s: str) -> str:
+    """Memoized collapse_ws() for report loops.
+
+    Triage compares the same field values (firm names, duty rates, signatures)
+    across regex, LLM and benchmark records, so repeat strings are common.
+    Only pass hashable str values.
+    """
+    return collapse_ws(s)
+
+
+def collapse_ws_series(s):
+    """Column-wise collapse_ws() for a pandas Series.
+
+    The regex runs once over the whole column via the .str accessor; values
+    that are not strings (None, numbers) are returned unchanged."""
+    is_str = s.map(lambda v: isinstance(v, str)).astype(bool)
+    if not is_str.any():
+        return s
+    collapsed = s.str.replace(_WS_RE, " ", regex=True).str.strip()
+    return collapsed.where(is_str, s)
+
+
+def normalize_records(records: List[Dict], fields: List[str], skip=("replying_person",)):
+    """Build an object-dtype DataFrame of `fields` (indexed by ruling_id) with
+    collapse_ws_series() applied to every column not in `skip`.
+    Missing fields become None, as with dict.get()."""
+    import pandas as pd
+
+    df = pd.DataFrame(
+        [[r.get(f) for f in fields] for r in records],
+        columns=fields,
+        index=pd.Index([r.get("ruling_id") for r in records], dtype=object),
+        dtype=object,
+    )
+    for f in fields:
+        if f not in skip:
+            df[f] = collapse_ws_series(df[f])
+    return df
 
 
 def normalize_text(text: str) -> str:
@@ -65,9 +264,10 @@ def normalize_text(text: str) -> str:
     
     Result: Consistent text ready for regex or LLM processing.
     """
-    text = text.replace("\r", "\n")
-    text = re.sub(r"[ \t]+", " ", text)
-    text = re.sub(r"\n{3,}", "\n\n", text)
+    if "\r" in text:
+        text = text.replace("\r", "\n")
+    text = _HSPACE_RE.sub(" ", text)
+    text = _MULTI_NL_RE.sub("\n\n", text)
     return text.strip()
 
 
@@ -76,14 +276,22 @@ def normalize_text(text: str) -> str:
 # =========================
 # Smart regex helper used by extractors to find ruling sections
 
-def first_match(patterns: List[str], text: str, flags=re.IGNORECASE) -> Optional[str]:
+@lru_cache(maxsize=1024)
+def _compile(pattern: str, flags: int) -> Pattern:
+    """Compile and memoize a (pattern, flags) pair for first_match()."""
+    return re.compile(pattern, flags)
+
+
+def first_match(patterns: List[Union[str, Pattern]], text: str, flags=re.IGNORECASE) -> Optional[str]:
     """
     Try multiple regex patterns in order, return first match (normalized).
     
     Args:
-        patterns: List of regex patterns to try
+        patterns: List of regex patterns to try. Plain strings are compiled once
+                  with `flags` and memoized; precompiled patterns are used as-is
+                  (their own flags apply).
         text: Input text to search
-        flags: Regex flags (default: case-insensitive)
+        flags: Regex flags for string patterns (default: case-insensitive)
     
     Returns:
         First matched group(1), normalized with collapse_ws(), or None
@@ -92,7 +300,9 @@ def first_match(patterns: List[str], text: str, flags=re.IGNORECASE) -> Optional
            Stops at first successful match.
     """
     for pat in patterns:
-        m = re.search(pat, text, flags)
+        if isinstance(pat, str):
+            pat = _compile(pat, flags)
+        m = pat.search(text)
         if m:
-            return re.sub(r"\s+", " ", m.group(1).strip())
+            return _WS_RE.sub(" ", m.group(1).strip())
     return None